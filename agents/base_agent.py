@@ -521,6 +521,9 @@ class BaseAgent(ABC):
         self.is_active = True
         self._error_count = 0
         self._transition_state(AgentState.IDLE)
+        
+        # Re-register in case a previous run shut this agent down
+        self.message_bus.register(self.name, self._handle_message)
         self.log(f"🟢 Agent started", "success")
         
         if BaseAgent._file_logger:
@@ -9,7 +9,7 @@ This module implements the central coordinator with:
 """
 import time
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from .base_agent import BaseAgent, AgentState
 from .data_loader import DataLoaderAgent
@@ -33,6 +33,18 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from benchmark import profile_function
 
 
+# Progress reported to callers at the start of each workflow phase: (percent, status message)
+PHASE_PROGRESS: Dict[str, Tuple[int, str]] = {
+    "PHASE 1: DATA LOADING": (15, "📂 Loading employee and store data..."),
+    "PHASE 2: DEMAND FORECASTING": (30, "📈 Forecasting demand..."),
+    "PHASE 3: INITIAL STAFF MATCHING": (50, "👥 Matching employees to shifts..."),
+    "PHASE 4: VALIDATION & REFINEMENT": (65, "⚖️ Validating Fair Work Act compliance..."),
+    "PHASE 5: FINAL VALIDATION": (80, "🔍 Running final validation..."),
+    "PHASE 6: GENERATING EXPLANATIONS": (90, "💬 Generating AI explanations..."),
+    "PHASE 7: EXPORTING ROSTER": (95, "📊 Exporting roster to Excel..."),
+}
+
+
 class CoordinatorAgent(BaseAgent):
     """
     Master coordinator that orchestrates all agents.
@@ -62,9 +74,11 @@ class CoordinatorAgent(BaseAgent):
         # Workflow state
         self.current_schedule: Optional[Schedule] = None
         self.compliance_result: Optional[ComplianceResult] = None
+        self.store: Optional[Store] = None
         self.workflow_log: List[Dict] = []
         self.start_time: Optional[float] = None
         self.end_time: Optional[float] = None
+        self._progress_callback: Optional[Callable[[int, str], None]] = None
         
     @profile_function
     def execute(self, 
@@ -73,6 +87,7 @@ class CoordinatorAgent(BaseAgent):
                 end_date: Optional[date] = None,
                 output_path: str = "output",
                 max_iterations: int = 5,
+                progress_callback: Optional[Callable[[int, str], None]] = None,
                 **kwargs) -> Dict[str, Any]:
         """
         Execute the complete scheduling workflow.
@@ -85,11 +100,16 @@ class CoordinatorAgent(BaseAgent):
             end_date: Last day of schedule (default: Dec 22, 2024)
             output_path: Directory for output files
             max_iterations: Max refinement iterations
+            progress_callback: Called with (percent, status message) as each
+                phase starts (on the thread running execute())
+            stream_summary: (kwarg) Skip the LLM summary during the run so
+                the caller can stream it afterwards with stream_summary()
             
         Returns:
             Dictionary with final results
         """
         self.start_time = time.time()
+        self._progress_callback = progress_callback
         
         # Default dates from the challenge
         if not start_date:
@@ -128,6 +148,7 @@ class CoordinatorAgent(BaseAgent):
             
             if not store:
                 raise ValueError(f"Store {store_id} not found")
+            self.store = store
             
             self._log_phase_complete(f"Loaded {len(employees)} employees, {len(stores)} stores, {len(managers)} managers")
             
@@ -200,6 +221,7 @@ class CoordinatorAgent(BaseAgent):
                 store=store,
                 demand_forecast=demand_forecast
             )
+            self.compliance_result = final_result
             self._log_phase_complete(f"Final score: {final_result.score:.1f}/100")
             
             # ========== PHASE 5.5: MANAGER APPROVAL ESCALATION ==========
@@ -212,7 +234,8 @@ class CoordinatorAgent(BaseAgent):
                 schedule=self.current_schedule,
                 compliance_result=final_result,
                 employees=employees,
-                store=store
+                store=store,
+                stream_summary=kwargs.get("stream_summary", False)
             )
             self._log_phase_complete("Explanations generated")
             
@@ -295,6 +318,36 @@ class CoordinatorAgent(BaseAgent):
                 BaseAgent._file_logger.info(f"SESSION ENDED - Total time: {elapsed:.2f}s")
                 BaseAgent._file_logger.info("=" * 70)
     
+    def reset(self) -> None:
+        """
+        Clear per-run state so this coordinator can be reused for another run.
+        
+        Loaded CSV data is kept, so repeated runs skip the data loading cost.
+        """
+        self.current_schedule = None
+        self.compliance_result = None
+        self.store = None
+        self.workflow_log = []
+        self.start_time = None
+        self.end_time = None
+        self._progress_callback = None
+        
+        self.conflict_resolver.resolution_history.clear()
+        self.conflict_resolver.negotiation_history.clear()
+        self.explainer.explanations.clear()
+        self.message_bus.clear_history()
+    
+    def stream_summary(self) -> Iterator[str]:
+        """
+        Stream the executive summary for the last completed run.
+        
+        Intended for execute(stream_summary=True), so the summary is
+        generated once and can be displayed as it arrives.
+        """
+        return self.explainer.stream_summary(
+            self.current_schedule, self.compliance_result, self.store
+        )
+    
     def _startup_all_agents(self) -> None:
         """Start up all agents with explicit lifecycle protocol."""
         agents = [
@@ -336,6 +389,9 @@ class CoordinatorAgent(BaseAgent):
             "timestamp": datetime.now().isoformat(),
             "type": "start"
         })
+        
+        if self._progress_callback and phase_name in PHASE_PROGRESS:
+            self._progress_callback(*PHASE_PROGRESS[phase_name])
     
     def _log_phase_complete(self, message: str) -> None:
         """Log the completion of a workflow phase."""
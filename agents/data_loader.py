@@ -41,22 +41,31 @@ class DataLoaderAgent(BaseAgent):
         # Manager data (monthly roster - fixed)
         self.managers: List[Manager] = []
         self.manager_coverage: Dict[date, ManagerCoverage] = {}
+        self._loaded = False
         
     def execute(self, **kwargs) -> Dict[str, Any]:
         """
         Load all data from CSV files.
         
+        Files are read on the first call only; later calls on the same agent
+        reuse the loaded data (the loaders append, so re-reading would
+        duplicate employees and managers).
+        
         Returns:
             Dictionary containing all loaded data
         """
-        self.log("Starting data loading process...")
-        
-        # Load all data
-        self._load_employees()
-        self._load_stores()
-        self._load_shift_codes()
-        self._load_rostering_parameters()
-        self._load_manager_roster()  # Load manager monthly roster
+        if self._loaded:
+            self.log("Reusing previously loaded data")
+        else:
+            self.log("Starting data loading process...")
+            
+            # Load all data
+            self._load_employees()
+            self._load_stores()
+            self._load_shift_codes()
+            self._load_rostering_parameters()
+            self._load_manager_roster()  # Load manager monthly roster
+            self._loaded = True
         
         # Prepare result
         result = {
@@ -2,13 +2,31 @@
 Explainer Agent - Generates human-readable explanations using LLM.
 Uses OpenRouter API with free models (Mistral, Gemma, etc.)
 """
+import asyncio
+import calendar
+import io
+import logging
 import os
-import time
+import string
+import textwrap
 from datetime import date
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+except ImportError:  # Optional dependency - concurrent calls fall back to batching
+    httpx = None
+
+try:
+    import orjson as _json
+except ImportError:  # Optional dependency - stdlib json is a drop-in fallback
+    import json as _json
 
 from .base_agent import BaseAgent
+from .llm_cache import SemanticLLMCache
 from communication.message import Message, MessageType
 from communication.message_bus import MessageBus
 from models.schedule import Schedule, Assignment
@@ -23,6 +41,117 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import config, get_api_key, llm_rate_limiter, retry_with_backoff
 
 
+LLM_SYSTEM_PROMPT = (
+    "You are a helpful assistant that explains restaurant scheduling decisions clearly and concisely."
+)
+
+# Static per-task instructions are sent as the system message, byte-identical
+# on every call, so providers with prompt caching can reuse the prefix. Only
+# the short data slice below each one varies and goes in the user message.
+SUMMARY_SYSTEM_PROMPT = LLM_SYSTEM_PROMPT + """
+
+Generate a brief, professional executive summary for the restaurant schedule described by the user.
+Keep it concise (3-4 sentences) and highlight key achievements or concerns.
+Start with the most important information."""
+
+ADVICE_SYSTEM_PROMPT = LLM_SYSTEM_PROMPT + """
+
+You are helping a McDonald's restaurant manager with scheduling decisions.
+The user lists staffing gaps that could not be automatically filled.
+
+Provide a brief (2-3 sentences), practical recommendation considering:
+- This is a fast-food restaurant with variable customer traffic
+- Staff safety and legal compliance are top priorities
+- Cross-training has already been attempted
+
+Be specific and actionable."""
+
+DECISION_SYSTEM_PROMPT = LLM_SYSTEM_PROMPT + """
+
+Explain the scheduling decision given by the user in simple terms for a restaurant manager.
+Keep it brief (2-3 sentences) and professional."""
+
+CONFLICT_SYSTEM_PROMPT = LLM_SYSTEM_PROMPT + """
+
+Summarize the scheduling conflicts given by the user for a restaurant manager.
+Provide a brief (2-3 sentence) summary highlighting the most critical issues."""
+
+# Dynamic user-message templates, parsed once at import and filled per call
+_SUMMARY_TMPL = string.Template("""Store: $store_name ($store_type)
+Period: $date_range
+Total Assignments: $total_assignments
+Employees: $unique_employees
+Total Hours: $total_hours
+Compliance Score: $score/100
+Violations: $hard_count hard, $soft_count soft""")
+
+_ADVICE_TMPL = string.Template("""Staffing gaps:
+$approval_text""")
+
+_DECISION_TMPL = string.Template("""Decision: $decision
+Context: $context""")
+
+_CONFLICT_TMPL = string.Template("""Conflicts:
+$violation_text""")
+
+
+# Enum display strings, resolved once at import for the per-row loops
+_STATION_LABEL: Dict[Station, str] = {s: s.value for s in Station}
+_EMPLOYEE_TYPE_LABEL: Dict[EmployeeType, str] = {t: t.value for t in EmployeeType}
+
+# Manager approval box borders (48 columns wide)
+_BOX_TOP = "┌" + "─" * 48 + "┐"
+_BOX_MID = "├" + "─" * 48 + "┤"
+_BOX_BOT = "└" + "─" * 48 + "┘"
+
+# Fixed tail of every approval box (each line is newline-prefixed)
+_MANAGER_OPTIONS_BLOCK = (
+    "\n" + _BOX_MID +
+    "\n│ MANAGER OPTIONS:"
+    "\n│   □ A) Accept understaffed shift             │"
+    "\n│   □ B) Authorize overtime for qualified staff│"
+    "\n│   □ C) Contact casual pool for coverage      │"
+    "\n│   □ D) Reduce station services temporarily   │"
+    "\n│   □ E) Request shift swap from other store   │"
+    "\n" + _BOX_BOT + "\n"
+)
+
+
+def _event_loop_running() -> bool:
+    """Whether this thread already runs an asyncio loop (asyncio.run would fail)."""
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+# Client errors that will fail the same way on every retry
+NON_RETRYABLE_STATUS_CODES = frozenset({400, 401, 403, 404, 429})
+
+
+class IncompleteStreamError(Exception):
+    """
+    Raised when a streamed completion ends without the final [DONE] event.
+    
+    Any text yielded before it is a truncated answer and must not be
+    cached or kept as the result.
+    """
+
+
+class NonRetryableAPIError(Exception):
+    """
+    Raised for API responses that retrying cannot fix.
+    
+    Deliberately not a requests.RequestException, so retry_with_backoff
+    lets it through immediately instead of backing off.
+    """
+    
+    def __init__(self, status_code: int):
+        super().__init__(f"OpenRouter returned HTTP {status_code}")
+        self.status_code = status_code
+
+
 class OpenRouterClient:
     """
     Simple client for OpenRouter API with rate limiting and retry.
@@ -44,6 +173,17 @@ class OpenRouterClient:
             "X-Title": "McDonald's Scheduling System"
         }
         self._call_count = 0
+        
+        # Persistent session so TCP/TLS connections are reused across calls
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=0)
+        )
+        self.session.headers.update(self.headers)
+    
+    # Separator between answers in a batched (multi-prompt) request
+    PROMPT_BOUNDARY = "\n---PROMPT_BOUNDARY---\n"
     
     @retry_with_backoff(
         max_retries=3,
@@ -51,14 +191,23 @@ class OpenRouterClient:
         max_delay=10.0,
         exceptions=(requests.RequestException, requests.Timeout)
     )
-    def _make_request(self, payload: dict) -> requests.Response:
-        """Make API request with retry logic."""
-        return requests.post(
+    def _make_request(self, payload: dict, stream: bool = False) -> requests.Response:
+        """
+        Make API request with retry logic.
+        
+        Network errors are retried with backoff; client errors in
+        NON_RETRYABLE_STATUS_CODES raise NonRetryableAPIError at once.
+        """
+        response = self.session.post(
             f"{self.base_url}/chat/completions",
-            headers=self.headers,
-            json=payload,
-            timeout=30
+            data=_json.dumps(payload),
+            timeout=30,
+            stream=stream
         )
+        if response.status_code in NON_RETRYABLE_STATUS_CODES:
+            response.close()
+            raise NonRetryableAPIError(response.status_code)
+        return response
     
     def chat_completion(self, 
                         messages: List[Dict[str, str]], 
@@ -93,14 +242,213 @@ class OpenRouterClient:
             })
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json.loads(response.content)
                 return data["choices"][0]["message"]["content"]
-            elif response.status_code == 429:
-                # Rate limited by API - wait and return None
-                return None
-            else:
-                return None
+            return None
+        
+        except NonRetryableAPIError:
+            # Client error or API rate limit - return None to trigger fallback
+            return None
+        except Exception as e:
+            return None
+    
+    def chat_completion_stream(self,
+                               messages: List[Dict[str, str]],
+                               model: str,
+                               max_tokens: int = 300,
+                               temperature: float = 0.7) -> Iterator[str]:
+        """
+        Stream a chat completion from OpenRouter as it is generated.
+        
+        Consumes the server-sent event stream line by line and yields each
+        content delta, so callers can display text from the first token.
+        
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            model: Model identifier
+            max_tokens: Maximum tokens in response
+            temperature: Sampling temperature
+            
+        Yields:
+            Text fragments
+        
+        Raises:
+            IncompleteStreamError: The call was rate limited or failed, or the
+                stream stopped before [DONE] (fragments so far are truncated)
+        """
+        if not llm_rate_limiter.acquire():
+            raise IncompleteStreamError("rate limited")
+        
+        try:
+            self._call_count += 1
+            
+            response = self._make_request({
+                "model": model,
+                "messages": messages,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                "stream": True,
+            }, stream=True)
+            
+            with response:
+                if response.status_code != 200:
+                    logging.warning(f"Streaming request to {model} failed: HTTP {response.status_code}")
+                    raise IncompleteStreamError(f"HTTP {response.status_code}")
                 
+                response.encoding = "utf-8"
+                for line in response.iter_lines(decode_unicode=True):
+                    # Skip keep-alive comments (": OPENROUTER PROCESSING") and blank lines
+                    if not line or not line.startswith("data: "):
+                        continue
+                    data = line[len("data: "):]
+                    if data == "[DONE]":
+                        return
+                    delta = _json.loads(data)["choices"][0].get("delta", {}).get("content")
+                    if delta:
+                        yield delta
+            
+            raise IncompleteStreamError("stream closed before [DONE]")
+        
+        except IncompleteStreamError:
+            raise
+        except Exception as e:
+            logging.warning(f"Streaming request to {model} failed: {e}")
+            raise IncompleteStreamError(str(e)) from e
+    
+    def chat_completion_batch(self,
+                              prompts_list: List[List[Dict[str, str]]],
+                              model: str,
+                              max_tokens: int = 300,
+                              temperature: float = 0.7) -> List[Optional[str]]:
+        """
+        Answer several chat prompts with as few API requests as possible.
+        
+        OpenRouter has no native multi-prompt batching, so prompts sharing a
+        system message are numbered and concatenated into one request under
+        that system message, and the model is asked to separate its answers
+        with PROMPT_BOUNDARY. Prompts with a system message of their own are
+        sent individually, as is every prompt of a batch whose response does
+        not split into exactly one answer per prompt.
+        
+        Args:
+            prompts_list: One message list per prompt
+            model: Model identifier
+            max_tokens: Maximum tokens per individual answer
+            temperature: Sampling temperature
+            
+        Returns:
+            One result per prompt (None where its request failed)
+        """
+        def _content(messages: List[Dict[str, str]], role: str) -> str:
+            return "\n".join(m["content"] for m in messages if m["role"] == role).strip()
+        
+        groups: Dict[str, List[int]] = {}
+        for i, messages in enumerate(prompts_list):
+            groups.setdefault(_content(messages, "system"), []).append(i)
+        
+        results: List[Optional[str]] = [None] * len(prompts_list)
+        for system, indices in groups.items():
+            if len(indices) == 1:
+                results[indices[0]] = self.chat_completion(
+                    prompts_list[indices[0]], model, max_tokens, temperature
+                )
+                continue
+            
+            count = len(indices)
+            sections = [
+                f"### PROMPT {n}\n" + _content(prompts_list[i], "user")
+                for n, i in enumerate(indices, 1)
+            ]
+            batch_prompt = (
+                f"Answer each of the {count} prompts below independently, in order.\n"
+                f"Write only the answers, separated by a line containing exactly "
+                f"{self.PROMPT_BOUNDARY.strip()}\n\n" + "\n\n".join(sections)
+            )
+            system_messages = [{"role": "system", "content": system}] if system else []
+            
+            result = self.chat_completion(
+                messages=system_messages + [{"role": "user", "content": batch_prompt}],
+                model=model,
+                max_tokens=max_tokens * count,
+                temperature=temperature
+            )
+            if result is None:
+                continue
+            
+            answers = [a.strip() for a in result.split(self.PROMPT_BOUNDARY.strip())]
+            # Tolerate a stray boundary line before the first or after the last answer
+            while answers and not answers[-1]:
+                answers.pop()
+            while answers and not answers[0]:
+                answers.pop(0)
+            if len(answers) == count and all(answers):
+                for i, answer in zip(indices, answers):
+                    results[i] = answer
+                continue
+            
+            # Misaligned split - any answer could belong to the wrong prompt
+            for i in indices:
+                results[i] = self.chat_completion(prompts_list[i], model, max_tokens, temperature)
+        
+        return results
+    
+    @property
+    def supports_async(self) -> bool:
+        """Whether concurrent async requests are available (requires httpx)."""
+        return httpx is not None
+    
+    def new_async_client(self) -> "httpx.AsyncClient":
+        """
+        Create an async HTTP client for one batch of concurrent requests.
+        
+        The client is bound to the event loop it is used in, so callers open
+        it with `async with` inside the coroutine rather than keeping it on
+        the instance. HTTP/2 is used when the h2 package is installed so all
+        requests share one multiplexed connection.
+        """
+        kwargs = {
+            "headers": self.headers,
+            "limits": httpx.Limits(max_connections=10),
+            "timeout": 30,
+        }
+        try:
+            return httpx.AsyncClient(http2=True, **kwargs)
+        except ImportError:
+            return httpx.AsyncClient(**kwargs)
+    
+    async def achat_completion(self,
+                               aclient: "httpx.AsyncClient",
+                               messages: List[Dict[str, str]],
+                               model: str,
+                               max_tokens: int = 300,
+                               temperature: float = 0.7) -> Optional[str]:
+        """
+        Async variant of chat_completion using a shared httpx client.
+        
+        Returns:
+            Generated text or None if failed/rate limited
+        """
+        if not llm_rate_limiter.acquire():
+            return None
+        
+        try:
+            self._call_count += 1
+            
+            response = await aclient.post(
+                f"{self.base_url}/chat/completions",
+                content=_json.dumps({
+                    "model": model,
+                    "messages": messages,
+                    "max_tokens": max_tokens,
+                    "temperature": temperature,
+                })
+            )
+            
+            if response.status_code == 200:
+                data = _json.loads(response.content)
+                return data["choices"][0]["message"]["content"]
+            return None
+        
         except Exception as e:
             return None
     
@@ -108,6 +456,10 @@ class OpenRouterClient:
     def call_count(self) -> int:
         """Get total API calls made."""
         return self._call_count
+    
+    def close(self) -> None:
+        """Release pooled HTTP connections."""
+        self.session.close()
 
 
 class ExplainerAgent(BaseAgent):
@@ -127,7 +479,9 @@ class ExplainerAgent(BaseAgent):
         super().__init__("Explainer", message_bus)
         self.use_llm = use_llm
         self.llm_client: Optional[OpenRouterClient] = None
+        self.llm_cache: Optional[SemanticLLMCache] = None
         self.explanations: List[str] = []
+        self.streamed_summary: Optional[str] = None  # Accepted text of the last stream_summary()
         
         # Model configuration from config
         self.primary_model = config.llm.primary_model
@@ -150,18 +504,70 @@ class ExplainerAgent(BaseAgent):
                 base_url=config.llm.base_url
             )
             self.log(f"OpenRouter client initialized (model: {self.primary_model})")
+            
+            # Sampled output above the max temperature is never reused, so
+            # don't load the embedding model for a cache that can't be used
+            if (config.llm.semantic_cache_enabled
+                    and self.temperature <= config.llm.semantic_cache_max_temperature):
+                self.llm_cache = SemanticLLMCache.shared(
+                    db_path=config.llm.semantic_cache_path,
+                    model_name=config.llm.semantic_cache_model,
+                    threshold=config.llm.semantic_cache_threshold
+                )
         else:
             self.log("No OpenRouter API key found - using template-based explanations", "warning")
             self.log("Set OPENROUTER_API_KEY in config.py or environment variable", "warning")
             self.use_llm = False
     
-    def _call_llm(self, prompt: str, use_fallback: bool = False) -> Optional[str]:
+    def _cache_enabled(self) -> bool:
+        """Whether the semantic cache applies at the current temperature."""
+        return (
+            self.llm_cache is not None
+            and self.temperature <= config.llm.semantic_cache_max_temperature
+        )
+    
+    def _cache_probe(self, prompt: str, model: str,
+                     system_prompt: str = LLM_SYSTEM_PROMPT,
+                     embedding=None) -> Tuple[Optional[str], Optional[Tuple]]:
+        """
+        Look up a prompt in the semantic cache.
+        
+        Args:
+            prompt: The user message
+            model: Model the response would come from
+            system_prompt: System message the response would be generated under
+            embedding: Precomputed prompt embedding (computed here if omitted)
+        
+        Returns:
+            (cached response or None, cache entry for storing a fresh result
+            or None when caching does not apply)
+        """
+        if not self._cache_enabled():
+            return None, None
+        
+        cache_key = SemanticLLMCache.make_key(system_prompt, model, self.temperature, prompt)
+        if embedding is None:
+            embedding = self.llm_cache.embed(prompt)
+        cached = self.llm_cache.get(cache_key, embedding)
+        if cached is not None:
+            self.log("LLM response served from semantic cache", "debug")
+        return cached, (cache_key, embedding)
+    
+    def _cache_store(self, cache_entry: Optional[Tuple], prompt: str, result: Optional[str]) -> None:
+        """Store a fresh LLM result in the semantic cache."""
+        if cache_entry is not None and result is not None:
+            cache_key, embedding = cache_entry
+            self.llm_cache.put(cache_key, prompt, embedding, result)
+    
+    def _call_llm(self, prompt: str, use_fallback: bool = False,
+                  system_prompt: str = LLM_SYSTEM_PROMPT) -> Optional[str]:
         """
         Call LLM with retry and fallback logic.
         
         Args:
-            prompt: The prompt to send
+            prompt: The user message (dynamic data only)
             use_fallback: Whether to use fallback model
+            system_prompt: Static instructions sent as the system message
             
         Returns:
             Generated text or None
@@ -171,8 +577,13 @@ class ExplainerAgent(BaseAgent):
         
         model = self.fallback_model if use_fallback else self.primary_model
         
+        # Semantic cache lookup (only for near-deterministic sampling)
+        cached, cache_entry = self._cache_probe(prompt, model, system_prompt)
+        if cached is not None:
+            return cached
+        
         messages = [
-            {"role": "system", "content": "You are a helpful assistant that explains restaurant scheduling decisions clearly and concisely."},
+            {"role": "system", "content": system_prompt},
             {"role": "user", "content": prompt}
         ]
         
@@ -184,19 +595,127 @@ class ExplainerAgent(BaseAgent):
             temperature=self.temperature
         )
         
+        self._cache_store(cache_entry, prompt, result)
+        
         # If primary fails and not already using fallback, try fallback
         if result is None and not use_fallback:
             self.log(f"Primary model failed, trying fallback: {self.fallback_model}", "warning")
-            time.sleep(config.llm.retry_delay)
-            result = self._call_llm(prompt, use_fallback=True)
+            result = self._call_llm(prompt, use_fallback=True, system_prompt=system_prompt)
         
         return result
     
+    def _call_llm_batch(self, prompts: Dict[str, Tuple[str, str]]) -> Dict[str, Optional[str]]:
+        """
+        Answer several named prompts with as few API round trips as possible.
+        
+        Cache hits are served locally. The remaining prompts run as concurrent
+        requests when httpx is installed, otherwise they go through
+        chat_completion_batch. Any prompt the primary model could not answer
+        there is retried with the fallback model.
+        
+        Args:
+            prompts: Mapping of section name to (system prompt, user prompt)
+            
+        Returns:
+            Mapping of section name to generated text (or None)
+        """
+        if not self.llm_client or not prompts:
+            return {name: None for name in prompts}
+        
+        # Embed every prompt for the cache probes in one batched forward pass
+        embeddings = [None] * len(prompts)
+        if self._cache_enabled():
+            embeddings = self.llm_cache.embed_many([prompt for _, prompt in prompts.values()])
+        
+        results: Dict[str, Optional[str]] = {}
+        pending: Dict[str, Tuple[str, str, Optional[Tuple]]] = {}
+        for (name, (system_prompt, prompt)), embedding in zip(prompts.items(), embeddings):
+            cached, cache_entry = self._cache_probe(
+                prompt, self.primary_model, system_prompt, embedding=embedding
+            )
+            if cached is not None:
+                results[name] = cached
+            else:
+                pending[name] = (system_prompt, prompt, cache_entry)
+        
+        if len(pending) > 1 and self.llm_client.supports_async and not _event_loop_running():
+            # Independent requests in parallel; each already tries the fallback model
+            concurrent_results = asyncio.run(self._acall_llm_many(list(pending.values())))
+            results.update(zip(pending.keys(), concurrent_results))
+        
+        elif len(pending) > 1:
+            batch_results = self.llm_client.chat_completion_batch(
+                [
+                    [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": prompt}
+                    ]
+                    for system_prompt, prompt, _ in pending.values()
+                ],
+                model=self.primary_model,
+                max_tokens=self.max_tokens,
+                temperature=self.temperature
+            )
+            for (name, (_, prompt, cache_entry)), result in zip(pending.items(), batch_results):
+                if result is not None:
+                    self._cache_store(cache_entry, prompt, result)
+                    results[name] = result
+        
+        for name, (system_prompt, prompt, _) in pending.items():
+            if name not in results:
+                use_fallback = len(pending) > 1  # The batch already tried the primary model
+                results[name] = self._call_llm(prompt, use_fallback=use_fallback,
+                                               system_prompt=system_prompt)
+        
+        return results
+    
+    async def _acall_llm(self, aclient: "httpx.AsyncClient", system_prompt: str, prompt: str,
+                         cache_entry: Optional[Tuple] = None) -> Optional[str]:
+        """Async LLM call that tries the primary model, then the fallback."""
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ]
+        
+        for model in (self.primary_model, self.fallback_model):
+            try:
+                result = await self.llm_client.achat_completion(
+                    aclient,
+                    messages=messages,
+                    model=model,
+                    max_tokens=self.max_tokens,
+                    temperature=self.temperature
+                )
+            except Exception as e:
+                self.log(f"Async LLM call failed ({model}): {e}", "warning")
+                result = None
+            
+            if result is not None:
+                if model == self.primary_model:
+                    self._cache_store(cache_entry, prompt, result)
+                return result
+            
+            if model == self.primary_model:
+                self.log(f"Primary model failed, trying fallback: {self.fallback_model}", "warning")
+        
+        return None
+    
+    async def _acall_llm_many(self, prompts: List[Tuple[str, str, Optional[Tuple]]]) -> List[Optional[str]]:
+        """Run several (system prompt, prompt, cache entry) LLM calls concurrently over one client."""
+        async with self.llm_client.new_async_client() as aclient:
+            return await asyncio.gather(
+                *[
+                    self._acall_llm(aclient, system_prompt, prompt, cache_entry)
+                    for system_prompt, prompt, cache_entry in prompts
+                ]
+            )
+    
     def execute(self,
                 schedule: Schedule,
                 compliance_result: ComplianceResult,
                 employees: List[Employee],
                 store: Store,
+                stream_summary: bool = False,
                 **kwargs) -> Dict[str, Any]:
         """
         Generate explanations for the schedule.
@@ -206,18 +725,54 @@ class ExplainerAgent(BaseAgent):
             compliance_result: Compliance validation results
             employees: List of employees
             store: Store configuration
+            stream_summary: Leave the LLM summary to stream_summary() (the
+                returned summary is then the template version)
             
         Returns:
             Dictionary containing various explanations
         """
         self.log("Generating schedule explanations...")
         
+        summary_data = schedule.summary()
+        
+        # Collect every LLM prompt up front so they share one round trip
+        llm_prompts: Dict[str, Tuple[str, str]] = {}
+        if self.use_llm and self.llm_client and self._needs_llm(compliance_result):
+            if not stream_summary:
+                llm_prompts["summary"] = (
+                    SUMMARY_SYSTEM_PROMPT,
+                    self._build_summary_prompt(summary_data, compliance_result, store)
+                )
+            if compliance_result.pending_approvals:
+                llm_prompts["manager_advice"] = (
+                    ADVICE_SYSTEM_PROMPT,
+                    self._build_manager_advice_prompt(compliance_result.pending_approvals)
+                )
+        llm_results = self._call_llm_batch(llm_prompts)
+        
+        # One tabular view of the assignments shared by the aggregate sections
+        assignments_df = self._build_assignments_frame(schedule)
+        dates = schedule.get_dates_in_range()
+        
+        # Per-employee totals, computed once for every section that needs them
+        per_employee = assignments_df.groupby("emp_id")["hours"].agg(["sum", "size"])
+        per_emp_hours: Dict[str, float] = per_employee["sum"].to_dict()
+        per_emp_shifts: Dict[str, int] = per_employee["size"].to_dict()
+        
         explanations = {
-            "summary": self._generate_summary(schedule, compliance_result, store),
-            "coverage_analysis": self._generate_coverage_analysis(schedule, store),
-            "employee_assignments": self._generate_employee_summary(schedule, employees),
+            "summary": self._generate_summary(
+                summary_data, compliance_result, store, llm_summary=llm_results.get("summary")
+            ),
+            "coverage_analysis": self._generate_coverage_analysis(
+                schedule, store, assignments_df, dates
+            ),
+            "employee_assignments": self._generate_employee_summary(
+                schedule, employees, per_emp_hours, per_emp_shifts
+            ),
             "compliance_notes": self._generate_compliance_notes(compliance_result),
-            "recommendations": self._generate_recommendations(schedule, compliance_result, employees),
+            "recommendations": self._generate_recommendations(
+                compliance_result, employees, per_emp_hours
+            ),
         }
         
         # If there were violations/warnings, explain them
@@ -226,7 +781,9 @@ class ExplainerAgent(BaseAgent):
         
         # If there are pending approvals, generate manager action items
         if compliance_result.pending_approvals:
-            explanations["manager_approvals"] = self._generate_manager_approvals(compliance_result)
+            explanations["manager_approvals"] = self._generate_manager_approvals(
+                compliance_result, advice=llm_results.get("manager_advice")
+            )
         
         # Send to Coordinator
         self.send(
@@ -241,16 +798,13 @@ class ExplainerAgent(BaseAgent):
         self.log("Explanations generated", "success")
         return explanations
     
-    def _generate_summary(self, schedule: Schedule, 
+    def _generate_summary(self, summary_data: Dict, 
                           compliance_result: ComplianceResult,
-                          store: Store) -> str:
+                          store: Store,
+                          llm_summary: Optional[str] = None) -> str:
         """Generate an executive summary of the schedule."""
-        summary_data = schedule.summary()
-        
-        if self.use_llm and self.llm_client:
-            llm_summary = self._llm_generate_summary(summary_data, compliance_result, store)
-            if llm_summary:
-                return llm_summary
+        if llm_summary:
+            return llm_summary
         
         # Template-based summary (fallback)
         status = "✅ COMPLIANT" if compliance_result.is_compliant else "⚠️ NEEDS REVIEW"
@@ -281,58 +835,158 @@ Scheduling System, optimizing for Fair Work Act compliance,
 peak period coverage, and employee preferences.
 """
     
-    def _llm_generate_summary(self, summary_data: Dict, 
-                               compliance_result: ComplianceResult,
-                               store: Store) -> Optional[str]:
-        """Generate summary using LLM."""
-        prompt = f"""
-Generate a brief, professional executive summary for this restaurant schedule:
-
-Store: {store.name} ({store.store_type.value})
-Period: {summary_data['date_range']}
-Total Assignments: {summary_data['total_assignments']}
-Employees: {summary_data['unique_employees']}
-Total Hours: {summary_data['total_hours']}
-Compliance Score: {compliance_result.score}/100
-Violations: {len(compliance_result.violations)} hard, {len(compliance_result.warnings)} soft
-
-Keep it concise (3-4 sentences) and highlight key achievements or concerns.
-Start with the most important information.
-"""
-        return self._call_llm(prompt)
+    def stream_summary(self, schedule: Schedule,
+                       compliance_result: ComplianceResult,
+                       store: Store) -> Iterator[str]:
+        """
+        Stream the executive summary token by token.
+        
+        Yields the LLM summary as it arrives (or a cached one in a single
+        piece). A stream that fails before any text is retried with the
+        fallback model; one that stops mid-answer is neither cached nor
+        kept. In those cases, or when the LLM is not used, the template
+        summary follows. The output is markdown: the plain-text template is
+        wrapped in a fenced block so its ruler and bullet layout survive
+        rendering. The accepted text is left in self.streamed_summary.
+        
+        Args:
+            schedule: The final schedule
+            compliance_result: Compliance validation results
+            store: Store configuration
+            
+        Yields:
+            Summary text fragments
+        """
+        summary_data = schedule.summary()
+        self.streamed_summary = None
+        interrupted = False
+        
+        if self.use_llm and self.llm_client and self._needs_llm(compliance_result):
+            prompt = self._build_summary_prompt(summary_data, compliance_result, store)
+            cached, cache_entry = self._cache_probe(prompt, self.primary_model, SUMMARY_SYSTEM_PROMPT)
+            if cached is not None:
+                self.streamed_summary = cached
+                yield cached
+                return
+            
+            for model in (self.primary_model, self.fallback_model):
+                chunks = []
+                try:
+                    for chunk in self.llm_client.chat_completion_stream(
+                        [
+                            {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                            {"role": "user", "content": prompt}
+                        ],
+                        model=model,
+                        max_tokens=self.max_tokens,
+                        temperature=self.temperature
+                    ):
+                        chunks.append(chunk)
+                        yield chunk
+                except IncompleteStreamError as e:
+                    self.log(f"Summary stream from {model} incomplete: {e}", "warning")
+                    if chunks:
+                        # Partial text is already on screen; don't stream another answer after it
+                        interrupted = True
+                        break
+                    continue
+                
+                if chunks:
+                    self.streamed_summary = "".join(chunks)
+                    if model == self.primary_model:
+                        self._cache_store(cache_entry, prompt, self.streamed_summary)
+                    return
+        
+        if interrupted:
+            yield "\n\n*Summary interrupted - showing the standard summary instead.*\n\n"
+        template = self._generate_summary(summary_data, compliance_result, store)
+        self.streamed_summary = f"```text\n{template.strip()}\n```"
+        yield self.streamed_summary
     
-    def _generate_coverage_analysis(self, schedule: Schedule, store: Store) -> str:
+    def _build_summary_prompt(self, summary_data: Dict, 
+                              compliance_result: ComplianceResult,
+                              store: Store) -> str:
+        """Build the LLM user message for the executive summary (see SUMMARY_SYSTEM_PROMPT)."""
+        return _SUMMARY_TMPL.substitute(
+            store_name=store.name,
+            store_type=store.store_type.value,
+            date_range=summary_data['date_range'],
+            total_assignments=summary_data['total_assignments'],
+            unique_employees=summary_data['unique_employees'],
+            total_hours=summary_data['total_hours'],
+            score=compliance_result.score,
+            hard_count=len(compliance_result.violations),
+            soft_count=len(compliance_result.warnings),
+        )
+    
+    def _needs_llm(self, compliance_result: ComplianceResult) -> bool:
+        """
+        Decide whether this schedule is worth an LLM call.
+        
+        A compliant schedule with no pending approvals and only a few warnings
+        is fully described by the templates, so the LLM is skipped when
+        config.llm.only_on_issues is set.
+        """
+        if not config.llm.only_on_issues:
+            return True
+        
+        return (
+            not compliance_result.is_compliant
+            or bool(compliance_result.pending_approvals)
+            or len(compliance_result.warnings) > config.llm.max_quiet_warnings
+        )
+    
+    @staticmethod
+    def _build_assignments_frame(schedule: Schedule) -> pd.DataFrame:
+        """Materialize the schedule's assignments as a DataFrame (one row each)."""
+        return pd.DataFrame(
+            [
+                {
+                    "emp_id": a.employee.id,
+                    "date": a.shift.date,
+                    "station": _STATION_LABEL[a.station],
+                    "hours": a.shift.hours,
+                }
+                for a in schedule.assignments
+            ],
+            columns=["emp_id", "date", "station", "hours"]
+        )
+    
+    def _generate_coverage_analysis(self, schedule: Schedule, store: Store,
+                                    assignments_df: pd.DataFrame,
+                                    dates: List[date]) -> str:
         """Generate analysis of coverage by period."""
         lines = [
             "\n📊 COVERAGE ANALYSIS",
             "=" * 50
         ]
         
-        # Analyze coverage by day of week
-        from collections import defaultdict
-        day_coverage = defaultdict(list)
-        
-        for target_date in schedule.get_dates_in_range():
-            day_name = target_date.strftime("%A")
-            assignments = schedule.get_assignments_by_date(target_date)
-            day_coverage[day_name].append(len(assignments))
+        # Analyze coverage by day of week (days without assignments count as 0)
+        daily_counts = (
+            assignments_df.groupby("date").size()
+            .reindex(dates, fill_value=0)
+        )
+        day_names = [calendar.day_name[d.weekday()] for d in dates]
+        day_coverage = daily_counts.groupby(day_names, sort=False).mean()
         
         lines.append("\nAverage Daily Coverage by Day of Week:")
-        for day, counts in day_coverage.items():
-            avg = sum(counts) / len(counts) if counts else 0
+        for day, avg in day_coverage.items():
             bar = "█" * int(avg / 2)
             lines.append(f"  {day[:3]}: {bar} ({avg:.1f} staff)")
         
         # Station breakdown
+        station_counts = assignments_df.groupby("station").size()
         lines.append("\nCoverage by Station:")
         for station in store.get_active_stations():
-            assignments = schedule.get_assignments_by_station(station)
-            lines.append(f"  {station.value}: {len(assignments)} shifts")
+            label = _STATION_LABEL[station]
+            lines.append(f"  {label}: {station_counts.get(label, 0)} shifts")
         
         return "\n".join(lines)
     
     def _generate_employee_summary(self, schedule: Schedule, 
-                                    employees: List[Employee]) -> str:
+                                    employees: List[Employee],
+                                    per_emp_hours: Dict[str, float],
+                                    per_emp_shifts: Dict[str, int]) -> str:
         """Generate summary of employee assignments."""
         lines = [
             "\n👥 EMPLOYEE ASSIGNMENTS",
@@ -344,26 +998,26 @@ Start with the most important information.
         by_type = defaultdict(list)
         
         for employee in employees:
-            assignments = schedule.get_assignments_by_employee(employee.id)
-            hours = sum(a.shift.hours for a in assignments)
-            by_type[employee.employee_type.value].append({
+            by_type[_EMPLOYEE_TYPE_LABEL[employee.employee_type]].append({
                 "name": employee.name,
-                "shifts": len(assignments),
-                "hours": hours,
+                "shifts": per_emp_shifts.get(employee.id, 0),
+                "hours": per_emp_hours.get(employee.id, 0.0),
                 "min": employee.weekly_hours_target[0],
                 "max": employee.weekly_hours_target[1],
             })
         
+        buf = io.StringIO()
+        buf.write("\n".join(lines))
         for emp_type, emp_list in by_type.items():
-            lines.append(f"\n{emp_type}:")
+            buf.write("\n\n%s:" % emp_type)
             for emp in sorted(emp_list, key=lambda x: x['hours'], reverse=True)[:5]:
                 status = "✓" if emp['min'] <= emp['hours'] / 2 <= emp['max'] else "!"
-                lines.append(
-                    f"  {status} {emp['name']}: {emp['shifts']} shifts, "
-                    f"{emp['hours']:.1f}h/2wk"
+                buf.write(
+                    "\n  %s %s: %s shifts, %.1fh/2wk"
+                    % (status, emp['name'], emp['shifts'], emp['hours'])
                 )
         
-        return "\n".join(lines)
+        return buf.getvalue()
     
     def _generate_compliance_notes(self, compliance_result: ComplianceResult) -> str:
         """Generate notes about compliance status."""
@@ -390,9 +1044,9 @@ Start with the most important information.
         
         return "\n".join(lines)
     
-    def _generate_recommendations(self, schedule: Schedule,
-                                   compliance_result: ComplianceResult,
-                                   employees: List[Employee]) -> str:
+    def _generate_recommendations(self, compliance_result: ComplianceResult,
+                                   employees: List[Employee],
+                                   per_emp_hours: Dict[str, float]) -> str:
         """Generate actionable recommendations."""
         lines = [
             "\n💡 RECOMMENDATIONS",
@@ -403,8 +1057,7 @@ Start with the most important information.
         
         # Check for understaffed employees
         for employee in employees:
-            assignments = schedule.get_assignments_by_employee(employee.id)
-            hours = sum(a.shift.hours for a in assignments)
+            hours = per_emp_hours.get(employee.id, 0.0)
             min_hours = employee.weekly_hours_target[0] * 2  # 2 weeks
             
             if hours < min_hours * 0.8:
@@ -450,7 +1103,8 @@ Start with the most important information.
         
         return "\n".join(lines)
     
-    def _generate_manager_approvals(self, compliance_result: ComplianceResult) -> str:
+    def _generate_manager_approvals(self, compliance_result: ComplianceResult,
+                                    advice: Optional[str] = None) -> str:
         """
         Generate detailed explanation for items requiring manager approval.
         
@@ -459,79 +1113,55 @@ Start with the most important information.
         - Why automated resolution failed
         - Available options for manual resolution
         """
-        lines = [
-            "\n📋 MANAGER APPROVAL REQUIRED",
-            "=" * 50,
-            "\nThe following items could not be automatically resolved",
-            "and require manager decision:\n"
-        ]
+        lines = [self._format_manager_approvals(compliance_result)]
+        
+        # Add LLM-generated contextual advice if available
+        if advice:
+            lines.append("\n💡 SYSTEM RECOMMENDATION:")
+            lines.append(advice)
         
+        return "\n".join(lines)
+    
+    def _format_manager_approvals(self, compliance_result: ComplianceResult) -> str:
+        """Format the approval boxes for pending items (template part only)."""
+        buf = io.StringIO()
+        buf.write(
+            "\n📋 MANAGER APPROVAL REQUIRED\n" + "=" * 50 +
+            "\n\nThe following items could not be automatically resolved"
+            "\nand require manager decision:\n"
+        )
+        
+        # Written straight into the buffer; each line is newline-prefixed
         for i, approval in enumerate(compliance_result.pending_approvals, 1):
-            lines.append(f"┌{'─' * 48}┐")
-            lines.append(f"│ ITEM {i}: {approval.constraint_type.value.upper():<38} │")
-            lines.append(f"├{'─' * 48}┤")
-            lines.append(f"│ Date: {str(approval.affected_date or 'N/A'):<41} │")
-            lines.append(f"│ Description: ")
-            
-            # Wrap description
-            desc = approval.description
-            while len(desc) > 45:
-                lines.append(f"│   {desc[:45]:<45} │")
-                desc = desc[45:]
-            lines.append(f"│   {desc:<45} │")
+            buf.write("\n" + _BOX_TOP)
+            buf.write("\n│ ITEM %d: %-38s │" % (i, approval.constraint_type.value.upper()))
+            buf.write("\n" + _BOX_MID)
+            buf.write("\n│ Date: %-41s │" % (approval.affected_date or "N/A"))
+            buf.write("\n│ Description: ")
+            for ln in textwrap.wrap(approval.description, width=45) or [""]:
+                buf.write("\n│   %-45s │" % ln)
             
             # Escalation reason
             reason = approval.details.get("escalation_reason", "Unable to resolve automatically")
-            lines.append(f"├{'─' * 48}┤")
-            lines.append(f"│ Why approval needed:")
-            for line in reason.split(". "):
-                if line:
-                    while len(line) > 43:
-                        lines.append(f"│   • {line[:43]}")
-                        line = line[43:]
-                    lines.append(f"│   • {line:<43} │")
+            buf.write("\n" + _BOX_MID)
+            buf.write("\n│ Why approval needed:")
+            for sentence in reason.split(". "):
+                for ln in textwrap.wrap(sentence, width=43):
+                    buf.write("\n│   • %-43s │" % ln)
             
             # Manager options
-            lines.append(f"├{'─' * 48}┤")
-            lines.append(f"│ MANAGER OPTIONS:")
-            lines.append(f"│   □ A) Accept understaffed shift             │")
-            lines.append(f"│   □ B) Authorize overtime for qualified staff│")
-            lines.append(f"│   □ C) Contact casual pool for coverage      │")
-            lines.append(f"│   □ D) Reduce station services temporarily   │")
-            lines.append(f"│   □ E) Request shift swap from other store   │")
-            lines.append(f"└{'─' * 48}┘")
-            lines.append("")
+            buf.write(_MANAGER_OPTIONS_BLOCK)
         
-        # Add LLM-generated contextual advice if available
-        if self.use_llm and self.llm_client and len(compliance_result.pending_approvals) > 0:
-            advice = self._generate_manager_advice(compliance_result.pending_approvals)
-            if advice:
-                lines.append("\n💡 SYSTEM RECOMMENDATION:")
-                lines.append(advice)
-        
-        return "\n".join(lines)
+        return buf.getvalue()
     
-    def _generate_manager_advice(self, pending_approvals) -> Optional[str]:
-        """Use LLM to generate contextual advice for manager."""
+    def _build_manager_advice_prompt(self, pending_approvals) -> str:
+        """Build the LLM user message for manager advice (see ADVICE_SYSTEM_PROMPT)."""
         approval_text = "\n".join([
             f"- {a.description} on {a.affected_date}"
             for a in pending_approvals[:3]
         ])
         
-        prompt = f"""
-You are an assistant helping a McDonald's restaurant manager with scheduling decisions.
-
-The following staffing gaps could not be automatically filled:
-{approval_text}
-
-Provide a brief (2-3 sentences), practical recommendation considering:
-- This is a fast-food restaurant with variable customer traffic
-- Staff safety and legal compliance are top priorities
-- Cross-training has already been attempted
-
-Be specific and actionable.
-"""
-        return self._call_llm(prompt)
+        return _ADVICE_TMPL.substitute(approval_text=approval_text)
     
     def explain_decision(self, decision: str, context: Dict) -> str:
         """
@@ -546,15 +1176,8 @@ Be specific and actionable.
             Human-readable explanation
         """
         if self.use_llm and self.llm_client:
-            prompt = f"""
-Explain this scheduling decision in simple terms for a restaurant manager:
-
-Decision: {decision}
-Context: {context}
-
-Keep it brief (2-3 sentences) and professional.
-"""
-            result = self._call_llm(prompt)
+            prompt = _DECISION_TMPL.substitute(decision=decision, context=context)
+            result = self._call_llm(prompt, system_prompt=DECISION_SYSTEM_PROMPT)
             if result:
                 return result
         
@@ -580,14 +1203,8 @@ Keep it brief (2-3 sentences) and professional.
                 for v in violations[:5]
             ])
             
-            prompt = f"""
-Summarize these scheduling conflicts for a restaurant manager:
-
-{violation_text}
-
-Provide a brief (2-3 sentence) summary highlighting the most critical issues.
-"""
-            result = self._call_llm(prompt)
+            prompt = _CONFLICT_TMPL.substitute(violation_text=violation_text)
+            result = self._call_llm(prompt, system_prompt=CONFLICT_SYSTEM_PROMPT)
             if result:
                 return result
         
@@ -595,6 +1212,12 @@ Provide a brief (2-3 sentence) summary highlighting the most critical issues.
         critical = [v for v in violations if v.severity >= 8]
         return f"Found {len(violations)} conflicts: {len(critical)} critical, {len(violations) - len(critical)} minor. Review recommended."
     
+    def shutdown(self) -> None:
+        """Shut down the agent and release pooled LLM connections."""
+        if self.llm_client:
+            self.llm_client.close()
+        super().shutdown()
+    
     def _on_request(self, message: Message) -> None:
         """Handle explanation requests from other agents."""
         content = message.content
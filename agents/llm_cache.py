@@ -0,0 +1,218 @@
+"""
+Semantic LLM Cache - Reuses completions for near-duplicate prompts.
+
+Prompts are embedded with a local SentenceTransformer model and compared
+against previously answered prompts by cosine similarity. When a stored
+prompt is similar enough, its completion is returned instead of making
+another OpenRouter round trip.
+
+Entries are partitioned by (system prompt and figures hash, model,
+temperature) so that completions produced under different instructions or
+sampling settings are never mixed, and persisted to SQLite so hits survive
+process restarts. The figures are the numbers in the prompt: explainer
+prompts differ mostly in their counts and scores, which an embedding barely
+sees, so numbers must match exactly and only the wording is matched
+semantically.
+"""
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # Optional dependency - cache is disabled without it
+    SentenceTransformer = None
+
+
+CacheKey = Tuple[str, str, float]
+
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+
+# Process-wide caches from SemanticLLMCache.shared(), one per configuration
+_shared_caches: Dict[Tuple[str, str, float], Optional["SemanticLLMCache"]] = {}
+_shared_lock = threading.Lock()
+
+
+class SemanticLLMCache:
+    """
+    Embedding-based response cache for LLM completions.
+
+    Features:
+    - Vectorized cosine lookup against all stored prompts for a cache key
+    - SQLite persistence (loaded into memory on startup)
+    - Thread-safe reads and writes
+    """
+
+    def __init__(self,
+                 db_path: str,
+                 model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+                 threshold: float = 0.92):
+        """
+        Initialize the cache and load persisted entries.
+
+        Args:
+            db_path: Path to the SQLite file backing the cache
+            model_name: SentenceTransformer model used to embed prompts
+            threshold: Minimum cosine similarity for a cache hit
+        """
+        self.db_path = db_path
+        self.threshold = threshold
+        self.model = SentenceTransformer(model_name)
+
+        # Per-key embedding matrix E (rows are unit vectors) and parallel responses
+        self._embeddings: Dict[CacheKey, np.ndarray] = {}
+        self._responses: Dict[CacheKey, List[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "system_hash TEXT, model TEXT, temperature REAL, "
+            "prompt TEXT, embedding BLOB, response TEXT)"
+        )
+        self._conn.commit()
+        self._load()
+
+    @classmethod
+    def create(cls, db_path: str, model_name: str,
+               threshold: float) -> Optional["SemanticLLMCache"]:
+        """
+        Build a cache, or return None if it cannot be used in this environment.
+
+        The cache is an optimization only, so a missing dependency or an
+        unreadable database must never break explanation generation.
+        """
+        if SentenceTransformer is None:
+            logging.info("sentence-transformers not installed - semantic LLM cache disabled")
+            return None
+        try:
+            return cls(db_path, model_name=model_name, threshold=threshold)
+        except Exception as e:
+            logging.warning(f"Semantic LLM cache unavailable: {e}")
+            return None
+
+    @classmethod
+    def shared(cls, db_path: str, model_name: str,
+               threshold: float) -> Optional["SemanticLLMCache"]:
+        """
+        Get the process-wide cache for this configuration, building it on first use.
+
+        Loading the embedding model is expensive, so every agent shares one
+        instance (and one SQLite connection) instead of creating its own.
+        A failed build is remembered too, so it is not retried per agent.
+        """
+        key = (db_path, model_name, threshold)
+        with _shared_lock:
+            if key not in _shared_caches:
+                _shared_caches[key] = cls.create(db_path, model_name, threshold)
+            return _shared_caches[key]
+
+    @staticmethod
+    def make_key(system_prompt: str, model: str, temperature: float,
+                 prompt: str = "") -> CacheKey:
+        """
+        Build the partition key for a system prompt / model / temperature.
+
+        The numbers in the prompt are hashed into the key as well, so a
+        semantic hit can never return another schedule's figures.
+        """
+        figures = " ".join(_NUMBER_RE.findall(prompt))
+        system_hash = hashlib.sha256(f"{system_prompt}\0{figures}".encode("utf-8")).hexdigest()[:16]
+        return (system_hash, model, round(float(temperature), 3))
+
+    def _load(self) -> None:
+        """Load persisted entries into the in-memory matrices."""
+        rows = self._conn.execute(
+            "SELECT system_hash, model, temperature, embedding, response FROM llm_cache"
+        ).fetchall()
+
+        grouped: Dict[CacheKey, List[np.ndarray]] = {}
+        for system_hash, model, temperature, blob, response in rows:
+            key = (system_hash, model, round(float(temperature), 3))
+            grouped.setdefault(key, []).append(np.frombuffer(blob, dtype=np.float32))
+            self._responses.setdefault(key, []).append(response)
+
+        for key, vectors in grouped.items():
+            self._embeddings[key] = np.vstack(vectors)
+
+    def embed(self, prompt: str) -> np.ndarray:
+        """Embed a prompt as a normalized float32 vector."""
+        return np.asarray(
+            self.model.encode(prompt, normalize_embeddings=True),
+            dtype=np.float32
+        )
+
+    def embed_many(self, prompts: List[str]) -> np.ndarray:
+        """
+        Embed several prompts in one batched forward pass.
+
+        Returns:
+            Matrix of normalized float32 vectors, one row per prompt
+        """
+        return np.asarray(
+            self.model.encode(
+                prompts,
+                batch_size=max(1, len(prompts)),
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            ),
+            dtype=np.float32
+        )
+
+    def get(self, key: CacheKey, embedding: np.ndarray) -> Optional[str]:
+        """
+        Look up a cached response for an embedded prompt.
+
+        Args:
+            key: Partition key from make_key()
+            embedding: Normalized prompt embedding from embed() or a row of embed_many()
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        with self._lock:
+            matrix = self._embeddings.get(key)
+            if matrix is None or len(matrix) == 0:
+                self.misses += 1
+                return None
+
+            # Rows and query are unit vectors, so the dot product is cosine similarity
+            sims = matrix @ embedding
+            best = int(np.argmax(sims))
+            if sims[best] > self.threshold:
+                self.hits += 1
+                return self._responses[key][best]
+
+            self.misses += 1
+            return None
+
+    def put(self, key: CacheKey, prompt: str,
+            embedding: np.ndarray, response: str) -> None:
+        """Store a response for an embedded prompt (memory and SQLite)."""
+        with self._lock:
+            row = embedding.reshape(1, -1)
+            matrix = self._embeddings.get(key)
+            self._embeddings[key] = row if matrix is None else np.vstack([matrix, row])
+            self._responses.setdefault(key, []).append(response)
+
+            self._conn.execute(
+                "INSERT INTO llm_cache VALUES (?, ?, ?, ?, ?, ?)",
+                (key[0], key[1], key[2], prompt, embedding.tobytes(), response)
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the backing database connection."""
+        with self._lock:
+            self._conn.close()
@@ -10,6 +10,7 @@ SECURITY: API keys should ALWAYS be loaded from environment variables.
 import os
 import time
 import logging
+import threading
 from dataclasses import dataclass, field
 from typing import List, Optional, Callable, Any
 from functools import wraps
@@ -47,7 +48,7 @@ class RateLimiter:
     """
     Simple rate limiter to prevent API cost explosion.
     
-    Implements a token bucket algorithm for rate limiting API calls.
+    Implements a sliding-window limit on API calls.
     """
     
     def __init__(self, max_calls: int = 10, period_seconds: float = 60.0):
@@ -92,8 +93,66 @@ class RateLimiter:
         return max(0, self.max_calls - len(self.calls))
 
 
-# Global rate limiter for LLM calls (10 calls per minute for free tier)
-llm_rate_limiter = RateLimiter(max_calls=10, period_seconds=60.0)
+class TokenBucket:
+    """
+    Token bucket rate limiter that allows short bursts.
+    
+    The bucket holds up to `capacity` tokens and refills continuously at
+    `refill_rate` tokens per second. Refill is computed lazily on each
+    acquire, so there is no background thread and no per-call history.
+    """
+    
+    def __init__(self, capacity: int = 20, refill_rate: float = 1.0 / 3.0):
+        """
+        Initialize token bucket.
+        
+        Args:
+            capacity: Maximum burst size (bucket starts full)
+            refill_rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self) -> None:
+        """Add tokens earned since the last refill (caller holds the lock)."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+    
+    def acquire(self, tokens: int = 1) -> bool:
+        """
+        Try to take tokens from the bucket.
+        
+        Args:
+            tokens: Number of tokens to take
+        
+        Returns:
+            True if call is allowed, False if rate limited
+        """
+        with self._lock:
+            self._refill()
+            if self.tokens < tokens:
+                return False
+            self.tokens -= tokens
+            return True
+    
+    def wait_if_needed(self) -> None:
+        """Block until a call is allowed."""
+        while not self.acquire():
+            time.sleep(0.5)
+    
+    def remaining(self) -> int:
+        """Get number of calls that can be made immediately."""
+        with self._lock:
+            self._refill()
+            return int(self.tokens)
+
+
+# Global rate limiter for LLM calls (bursts of 20, sustained 20 calls per minute)
+llm_rate_limiter = TokenBucket(capacity=20, refill_rate=1.0 / 3.0)
 
 
 # =============================================================================
@@ -309,7 +368,20 @@ class LLMConfig:
     max_retries: int = 3
     base_delay: float = 1.0
     retry_delay: float = 1.0  # Alias for base_delay (backwards compatibility)
-    
+
+    # Only spend LLM calls on schedules with something to explain
+    only_on_issues: bool = True
+    max_quiet_warnings: int = 2  # Warnings tolerated before a clean schedule uses the LLM
+
+    # Semantic response cache (requires sentence-transformers). Off by default:
+    # it only applies when temperature <= semantic_cache_max_temperature, so
+    # to opt in, enable it and lower temperature (e.g. to 0.2) as well.
+    semantic_cache_enabled: bool = False
+    semantic_cache_path: str = "output/explainer_cache.db"
+    semantic_cache_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    semantic_cache_threshold: float = 0.92  # Min cosine similarity for a hit
+    semantic_cache_max_temperature: float = 0.3  # Sampled output above this is not reused
+
     @property
     def api_key(self) -> str:
         """Get API key from environment (never stored in config)."""
@@ -58,6 +58,7 @@ class Schedule:
     _by_date: Dict[date, List[Assignment]] = field(default_factory=lambda: defaultdict(list))
     _by_employee: Dict[str, List[Assignment]] = field(default_factory=lambda: defaultdict(list))
     _by_station: Dict[Station, List[Assignment]] = field(default_factory=lambda: defaultdict(list))
+    _by_employee_date: Dict[Tuple[str, date], List[Assignment]] = field(default_factory=lambda: defaultdict(list))
     
     def add_assignment(self, assignment: Assignment) -> None:
         """Add an assignment to the schedule."""
@@ -65,6 +66,7 @@ class Schedule:
         self._by_date[assignment.shift.date].append(assignment)
         self._by_employee[assignment.employee.id].append(assignment)
         self._by_station[assignment.station].append(assignment)
+        self._by_employee_date[(assignment.employee.id, assignment.shift.date)].append(assignment)
     
     def remove_assignment(self, assignment: Assignment) -> bool:
         """Remove an assignment from the schedule."""
@@ -76,6 +78,7 @@ class Schedule:
             self._by_date[assignment.shift.date].remove(assignment)
             self._by_employee[assignment.employee.id].remove(assignment)
             self._by_station[assignment.station].remove(assignment)
+            self._by_employee_date[(assignment.employee.id, assignment.shift.date)].remove(assignment)
             return True
         return False
     
@@ -128,9 +131,10 @@ class Schedule:
     def get_coverage_by_station(self, target_date: date, 
                                  time_slot: TimeSlot) -> Dict[Station, int]:
         """Get coverage breakdown by station for a date and time slot."""
-        coverage = {}
-        for station in Station:
-            coverage[station] = self.get_coverage(target_date, time_slot, station)
+        coverage = {station: 0 for station in Station}
+        for a in self.get_assignments_by_date(target_date):
+            if a.shift.overlaps_time_slot(time_slot):
+                coverage[a.station] += 1
         return coverage
     
     def get_peak_coverage(self, target_date: date) -> Dict[str, int]:
@@ -151,10 +155,7 @@ class Schedule:
     
     def is_employee_assigned(self, employee_id: str, target_date: date) -> bool:
         """Check if employee is already assigned on a date."""
-        return any(
-            a.shift.date == target_date 
-            for a in self.get_assignments_by_employee(employee_id)
-        )
+        return bool(self._by_employee_date.get((employee_id, target_date)))
     
     def get_last_shift_end(self, employee_id: str, 
                            before_date: date) -> Optional[datetime]:
@@ -11,6 +11,7 @@ and comprehensive compliance reporting.
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import time
 import os
 import sys
@@ -18,16 +19,23 @@ from datetime import date, datetime, timedelta
 from pathlib import Path
 import json
 import threading
+import types
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 import queue
+import shelve
+import hashlib
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Data directory, resolved once at import (bundled data/ or the challenge folder)
+_HERE = Path(__file__).parent
+DATA_DIR = str(_HERE / "data") if (_HERE / "data").exists() else str(_HERE.parent / "Yep AI Challenge")
+
 # Import our scheduling system
 from communication.message_bus import MessageBus
-from agents.coordinator import CoordinatorAgent
+from agents.coordinator import CoordinatorAgent, PHASE_PROGRESS
 from agents.base_agent import BaseAgent
 
 # ============================================================================
@@ -45,439 +53,53 @@ st.set_page_config(
 # CUSTOM CSS FOR PROFESSIONAL STYLING
 # ============================================================================
 
-st.markdown("""
-<style>
-    /* Import DM Sans font */
-    @import url('https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700&display=swap');
+try:
+    from csscompressor import compress as compress_css
+except ImportError:  # Optional dependency - the stylesheet is sent as written
+    compress_css = None
 
-    /* Apply DM Sans font globally */
-    * {
-        font-family: 'DM Sans', sans-serif !important;
-    }
 
-    /* Main container */
-    .main .block-container {
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-        max-width: 100%;
-    }
-    
-    /* Header styling */
-    .main-header {
-        background: linear-gradient(135deg, #DA291C 0%, #FFC72C 100%);
-        padding: 1.5rem 2rem;
-        border-radius: 12px;
-        margin-bottom: 2rem;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
-    
-    .main-header h1 {
-        color: white;
-        margin: 0;
-        font-size: 2.2rem;
-        font-weight: 700;
-    }
-    
-    .main-header p {
-        color: rgba(255, 255, 255, 0.9);
-        margin: 0.5rem 0 0 0;
-        font-size: 1rem;
-    }
-    
-    /* Metric cards */
-    .metric-card {
-        background: white;
-        border-radius: 12px;
-        padding: 1.5rem;
-        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.08);
-        border: 1px solid #E5E7EB;
-        text-align: center;
-        transition: transform 0.2s, box-shadow 0.2s;
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.12);
-    }
-    
-    .metric-value {
-        font-size: 2.5rem;
-        font-weight: 700;
-        color: #27251F;
-        line-height: 1;
-    }
-    
-    .metric-label {
-        font-size: 0.9rem;
-        color: #6B7280;
-        margin-top: 0.5rem;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-    
-    .metric-success { color: #10B981; }
-    .metric-warning { color: #F59E0B; }
-    .metric-error { color: #EF4444; }
-    .metric-primary { color: #DA291C; }
-    
-    /* Agent status cards */
-    .agent-card {
-        background: white;
-        border-radius: 8px;
-        padding: 1rem;
-        margin-bottom: 0.5rem;
-        border-left: 4px solid #E5E7EB;
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-    }
-    
-    .agent-card.running { border-left-color: #3B82F6; background: #EFF6FF; }
-    .agent-card.completed { border-left-color: #10B981; }
-    .agent-card.pending { border-left-color: #9CA3AF; }
-    .agent-card.error { border-left-color: #EF4444; background: #FEF2F2; }
-    
-    /* Section headers */
-    .section-header {
-        font-size: 1.25rem;
-        font-weight: 600;
-        color: #27251F;
-        margin-bottom: 1rem;
-        padding-bottom: 0.5rem;
-        border-bottom: 2px solid #DA291C;
-    }
-    
-    /* Compliance checkmarks */
-    .compliance-item {
-        display: flex;
-        align-items: center;
-        padding: 0.75rem;
-        background: #F0FDF4;
-        border-radius: 8px;
-        margin-bottom: 0.5rem;
-    }
-    
-    .compliance-item.warning {
-        background: #FFFBEB;
-    }
-    
-    /* Button styling */
-    .stButton > button {
-        background: linear-gradient(135deg, #DA291C 0%, #B91C1C 100%);
-        color: white;
-        border: none;
-        padding: 0.75rem 2rem;
-        font-size: 1.1rem;
-        font-weight: 600;
-        border-radius: 8px;
-        width: 100%;
-        transition: all 0.2s;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-1px);
-        box-shadow: 0 4px 12px rgba(218, 41, 28, 0.4);
-    }
-    
-    /* Progress bar */
-    .stProgress > div > div {
-        background: linear-gradient(90deg, #DA291C 0%, #FFC72C 100%);
-    }
-    
-    /* Data tables */
-    .dataframe {
-        font-size: 0.9rem;
-    }
-    
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-
-    /* Expander styling */
-    .streamlit-expanderHeader {
-        font-weight: 600;
-        color: #27251F;
-        overflow: hidden !important;
-        position: relative !important;
-    }
-    
-    /* Hide overlapping "oa" text in expander - make it transparent */
-    .stExpander summary,
-    .stExpander summary *,
-    .streamlit-expanderHeader * {
-        overflow: hidden !important;
-        text-overflow: ellipsis !important;
-    }
-    
-    /* Make any overlapping text transparent */
-    .stExpander summary span:not(:first-child),
-    .streamlit-expanderHeader span:not(:first-child) {
-        opacity: 0 !important;
-        color: transparent !important;
-        font-size: 0 !important;
-        width: 0 !important;
-        height: 0 !important;
-        display: none !important;
-    }
-    
-    /* Specifically target any "oa" or overlapping text */
-    .stExpander summary::after,
-    .streamlit-expanderHeader::after {
-        content: "" !important;
-        display: none !important;
-    }
-    
-    /* Hide any duplicate or overlapping text in expanders */
-    .stExpander summary span.st-emotion-cache-1tz5wcb,
-    .stExpander summary span[class*="e1t4gh342"] {
-        opacity: 0 !important;
-        color: transparent !important;
-        visibility: hidden !important;
-        display: none !important;
-    }
+@st.cache_data(show_spinner=False)
+def _get_css() -> str:
+    """Load (and minify, if possible) the app stylesheet once per process."""
+    css = (_HERE / "styles.css").read_text(encoding="utf-8")
+    if compress_css is not None:
+        css = compress_css(css)
+    return f"<style>\n{css}\n</style>"
 
-    /* Reposition markdown container for better layout */
-    .st-emotion-cache-cpqr4g.et2rgd20 {
-        position: relative !important;
-        order: -1 !important;
-        z-index: 1 !important;
-    }
-    
-    /* Loading Skeleton Animation */
-    @keyframes skeleton-pulse {
-        0% { background-position: -200% 0; }
-        100% { background-position: 200% 0; }
-    }
-    
-    .skeleton {
-        background: linear-gradient(
-            90deg,
-            #f0f0f0 25%,
-            #e0e0e0 50%,
-            #f0f0f0 75%
-        );
-        background-size: 200% 100%;
-        animation: skeleton-pulse 1.5s infinite ease-in-out;
-        border-radius: 8px;
-    }
-    
-    .skeleton-text {
-        height: 1rem;
-        margin: 0.5rem 0;
-    }
-    
-    .skeleton-metric {
-        height: 4rem;
-        margin: 0.5rem 0;
-    }
-    
-    .skeleton-card {
-        height: 120px;
-        margin: 1rem 0;
-    }
-    
-    /* Error Boundary Styling */
-    .error-boundary {
-        background: #FEF2F2;
-        border: 1px solid #FCA5A5;
-        border-radius: 8px;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    
-    .error-boundary h3 {
-        color: #DC2626;
-        margin: 0 0 0.5rem 0;
-    }
-    
-    .error-boundary p {
-        color: #7F1D1D;
-        margin: 0;
-    }
-    
-    .warning-banner {
-        background: #FFFBEB;
-        border: 1px solid #FCD34D;
-        border-radius: 8px;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    
-    /* Fix text overflow and prevent text squishing */
-    * {
-        word-wrap: break-word !important;
-        overflow-wrap: break-word !important;
-    }
-    
-    /* Fix font rendering to prevent character overlap */
-    body, html {
-        text-rendering: optimizeLegibility !important;
-        -webkit-font-smoothing: antialiased !important;
-        -moz-osx-font-smoothing: grayscale !important;
-    }
-    
-    /* Fix Streamlit widget labels and text - prevent squishing */
-    .stSelectbox label,
-    .stTextInput label,
-    .stSlider label,
-    .stCheckbox label,
-    .stDateInput label,
-    .stButton label,
-    .stMarkdown label {
-        white-space: normal !important;
-        word-wrap: break-word !important;
-        overflow: visible !important;
-        text-overflow: clip !important;
-        display: block !important;
-        width: 100% !important;
-    }
-    
-    /* Prevent text squishing in all text elements */
-    label,
-    p,
-    span:not([class*="icon"]):not([class*="emoji"]),
-    div:not([class*="skeleton"]) {
-        white-space: normal !important;
-        word-break: break-word !important;
-        overflow-wrap: break-word !important;
-    }
-    
-    /* Ensure proper spacing and prevent overlap in Streamlit widgets */
-    .stSelectbox > div,
-    .stTextInput > div,
-    .stSlider > div,
-    .stCheckbox > div,
-    .stDateInput > div {
-        overflow: visible !important;
-        position: relative !important;
-    }
-    
-    /* Hide any debug or internal "key" attributes that might be visible */
-    [data-testid*="key"]:empty,
-    [aria-label*="key"]:empty {
-        display: none !important;
-    }
-    
-    /* Fix any text that might be overlapping */
-    .stMarkdown,
-    .stText {
-        line-height: 1.5 !important;
-        letter-spacing: normal !important;
-    }
-    
-    /* Ensure Streamlit widgets don't show internal keys or empty elements */
-    [class*="st"] label:empty,
-    [class*="st"] span:empty {
-        display: none !important;
-    }
-    
-    /* Prevent text from being cut off or overlapping */
-    .stSelectbox,
-    .stTextInput,
-    .stSlider,
-    .stCheckbox,
-    .stDateInput,
-    .stButton {
-        overflow: visible !important;
-        white-space: normal !important;
-    }
-    
-    /* Fix for widget labels to prevent overlap */
-    .stSelectbox > label,
-    .stTextInput > label,
-    .stSlider > label,
-    .stCheckbox > label,
-    .stDateInput > label {
-        position: relative !important;
-        z-index: 1 !important;
-        background: transparent !important;
-        display: block !important;
-        margin-bottom: 0.5rem !important;
-        width: 100% !important;
-    }
-    
-    /* Ensure proper spacing between elements to prevent text overlap */
-    .stSelectbox,
-    .stTextInput,
-    .stSlider,
-    .stCheckbox,
-    .stDateInput {
-        margin-bottom: 1rem !important;
-    }
-    
-    /* Fix for any hidden text that might be causing issues */
-    [style*="display: none"],
-    [hidden],
-    .hidden {
-        display: none !important;
-        visibility: hidden !important;
-        opacity: 0 !important;
-        height: 0 !important;
-        width: 0 !important;
-        overflow: hidden !important;
-    }
-    
-    /* Make any overlapping "oa" or duplicate text transparent/colorless */
-    span.st-emotion-cache-1tz5wcb.e1t4gh342,
-    span[class*="e1t4gh342"],
-    .stExpander summary span:last-child:not(:only-child),
-    .streamlit-expanderHeader span:last-child:not(:only-child) {
-        opacity: 0 !important;
-        color: transparent !important;
-        background: transparent !important;
-        visibility: hidden !important;
-        display: none !important;
-        position: absolute !important;
-        left: -9999px !important;
-    }
-    
-    /* Target any text that appears to be overlapping in expander headers */
-    .stExpander summary > span:not(:first-of-type),
-    .streamlit-expanderHeader > span:not(:first-of-type) {
-        opacity: 0 !important;
-        color: transparent !important;
-        display: none !important;
-    }
-    
-    /* Ensure expander header only shows the main text */
-    .stExpander summary {
-        overflow: hidden !important;
-        text-overflow: ellipsis !important;
-        white-space: nowrap !important;
-    }
-    
-    .stExpander summary > *:first-child {
-        display: inline-block !important;
-    }
-    
-    .stExpander summary > *:not(:first-child) {
-        display: none !important;
-        opacity: 0 !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+
+st.markdown(_get_css(), unsafe_allow_html=True)
 
 # ============================================================================
 # SESSION STATE INITIALIZATION (WITH PERSISTENCE)
 # ============================================================================
 
+# Immutable defaults, built once per process rather than on every rerun
+_SESSION_DEFAULTS = types.MappingProxyType({
+    'scheduling_complete': False,
+    'results': None,
+    'is_running': False,
+    'schedule_df': None,
+    'filter_options': None,
+    'names_lc': None,
+    'coordinator': None,
+    'preview_page': 0,
+    'log_content': "",
+    'current_store': None,
+    'last_error': None,
+    'health_status': None,
+})
+
+
 def init_session_state():
     """Initialize session state with defaults. Supports page refresh persistence."""
-    defaults = {
-        'scheduling_complete': False,
-        'results': None,
-        'agent_status': {},
-        'is_running': False,
-        'schedule_df': None,
-        'log_content': "",
-        'store_results': {},  # Stores results per store for comparison
-        'current_store': None,
-        'last_error': None,
-        'health_status': None,
-    }
-    for key, value in defaults.items():
-        if key not in st.session_state:
-            st.session_state[key] = value
+    for key, value in _SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, value)
+    # Mutable defaults: each session needs its own objects
+    st.session_state.setdefault('agent_status', {})
+    # Held from the click until the worker thread finishes, so a rerun
+    # cannot start a second run on the same coordinator
+    st.session_state.setdefault('run_lock', threading.Lock())
 
 init_session_state()
 
@@ -502,6 +124,11 @@ def show_error_boundary(error: Exception, context: str = ""):
     st.session_state.last_error = str(error)
 
 
+def section_header(title: str) -> None:
+    """Draw a divider and a section header as one element."""
+    st.markdown(f'---\n\n<div class="section-header">{title}</div>', unsafe_allow_html=True)
+
+
 def show_loading_skeleton(num_cards: int = 4):
     """Display loading skeleton while data is being processed."""
     cols = st.columns(num_cards)
@@ -529,17 +156,155 @@ def safe_execute(func, *args, context: str = "", **kwargs):
         return None, False
 
 
+def read_roster_sheet(path: str) -> pd.DataFrame:
+    """
+    Read the Roster sheet of an exported schedule.
+    
+    Uses the Rust-backed calamine engine when python-calamine is installed
+    (pandas >= 2.2), otherwise the default openpyxl engine.
+    """
+    try:
+        return pd.read_excel(path, sheet_name='Roster', engine='calamine')
+    except (ImportError, ValueError):
+        return pd.read_excel(path, sheet_name='Roster')
+
+
+# Only the end of the log is kept in session state and re-sent on reruns
+LOG_TAIL_BYTES = 64 * 1024
+
+
+def read_log_tail(path: str, max_bytes: int = LOG_TAIL_BYTES) -> str:
+    """Read at most the last max_bytes of a log file, starting on a whole line."""
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        f.seek(max(0, size - max_bytes))
+        data = f.read()
+    if size > max_bytes:
+        # Drop the partial first line and mark the truncation
+        data = b"... (earlier log lines omitted)\n" + data.split(b"\n", 1)[-1]
+    return data.decode('utf-8', errors='replace')
+
+
+@st.fragment
+def render_log_viewer(log_file: Optional[str]):
+    """Show the log tail, loading the full log only on request."""
+    if not st.session_state.log_content:
+        st.info("Log file not available.")
+        return
+    
+    if log_file and os.path.exists(log_file) and st.button("View full log"):
+        with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
+            st.code(f.read(), language="text")
+    else:
+        st.code(st.session_state.log_content, language="text")
+
+
+# Per-store run summaries for the comparison view, kept on disk rather than
+# in session state (survives restarts, nothing re-serialized per rerun).
+# The file is shared by every session, so the UI labels it as shared.
+STORE_RESULTS_PATH = str(_HERE / "output" / "store_results")
+
+
+def _data_fingerprint(data_dir: str) -> str:
+    """Short hash of the input CSVs' names and modification times."""
+    stamps = sorted(
+        (entry.name, entry.stat().st_mtime_ns)
+        for entry in os.scandir(data_dir)
+        if entry.name.endswith(".csv")
+    ) if os.path.isdir(data_dir) else []
+    return hashlib.sha256(repr(stamps).encode("utf-8")).hexdigest()[:12]
+
+
+class StoreResultsCache:
+    """
+    Thread-safe wrapper around the shared on-disk store results shelf.
+    
+    One handle is used by all sessions and worker threads, and shelve's
+    dbm backends are not safe for concurrent writers, so every access
+    goes through a single lock.
+    
+    Entries are keyed by "<data fingerprint>:<store id>", so results computed
+    from older input CSVs stop counting as soon as the data changes (and are
+    pruned on the next save).
+    """
+    
+    def __init__(self, path: str, data_dir: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._shelf = shelve.open(path)
+        self._lock = threading.Lock()
+        self.data_dir = data_dir
+    
+    def _prefix(self) -> str:
+        return f"{_data_fingerprint(self.data_dir)}:"
+    
+    def __len__(self) -> int:
+        prefix = self._prefix()
+        with self._lock:
+            return sum(1 for key in self._shelf.keys() if key.startswith(prefix))
+    
+    def put(self, store_id: str, summary: Dict[str, Any]) -> None:
+        """Save (and flush) the run summary for a store, dropping stale entries."""
+        prefix = self._prefix()
+        with self._lock:
+            for key in [key for key in self._shelf.keys() if not key.startswith(prefix)]:
+                del self._shelf[key]
+            self._shelf[prefix + store_id] = summary
+            self._shelf.sync()
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Copy of the summaries for the current data, keyed by store id."""
+        prefix = self._prefix()
+        with self._lock:
+            return {
+                key[len(prefix):]: summary
+                for key, summary in self._shelf.items()
+                if key.startswith(prefix)
+            }
+    
+    def clear(self) -> None:
+        """Remove all saved summaries."""
+        with self._lock:
+            self._shelf.clear()
+            self._shelf.sync()
+
+
+@st.cache_resource
+def _store_cache() -> StoreResultsCache:
+    """Open the on-disk store results cache once per process."""
+    return StoreResultsCache(STORE_RESULTS_PATH, DATA_DIR)
+
+
+def get_coordinator() -> CoordinatorAgent:
+    """
+    Get this session's coordinator, building the message bus and agents on first use.
+    
+    It lives in session state, so it is released with the session. The
+    coordinator keeps per-run state: only touch it (reset()/execute())
+    while holding st.session_state.run_lock.
+    """
+    if st.session_state.coordinator is None:
+        st.session_state.coordinator = CoordinatorAgent(MessageBus(verbose=False), data_dir=DATA_DIR)
+    return st.session_state.coordinator
+
+
 # ============================================================================
 # HEALTH CHECK DISPLAY
 # ============================================================================
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_health() -> dict:
+    """Run the health checks at most once every 30 seconds."""
+    from config import health_checker
+    return health_checker.run_all_checks()
+
+
+@st.fragment
 def display_health_check():
-    """Display system health check status in sidebar."""
+    """Display system health check status (call inside the sidebar)."""
     try:
-        from config import health_checker
-        health = health_checker.run_all_checks()
+        health = _cached_health()
         
-        st.sidebar.markdown("### 🏥 System Health")
+        st.markdown("### 🏥 System Health")
         
         status_emoji = {
             "healthy": "🟢",
@@ -548,24 +313,25 @@ def display_health_check():
         }
         
         status = health.get("status", "unknown")
-        st.sidebar.markdown(f"**Status:** {status_emoji.get(status, '⚪')} {status.upper()}")
+        st.markdown(f"**Status:** {status_emoji.get(status, '⚪')} {status.upper()}")
         
         for check in health.get("checks", []):
             icon = "✅" if check["healthy"] else "❌"
-            st.sidebar.markdown(f"- {icon} {check['name']}: {check['message']}")
+            st.markdown(f"- {icon} {check['name']}: {check['message']}")
         
         st.session_state.health_status = health
         
     except Exception as e:
-        st.sidebar.warning(f"Health check unavailable: {e}")
+        st.warning(f"Health check unavailable: {e}")
 
 
 # Show health check in sidebar
 with st.sidebar:
     display_health_check()
-    st.markdown("---")
-    st.markdown("### 📊 Session Info")
-    st.markdown(f"Results cached: {len(st.session_state.store_results)} stores")
+    st.markdown("---\n\n### 📊 Session Info")
+    # Placeholder so a run on this page can refresh the count in place
+    cached_count_slot = st.empty()
+    cached_count_slot.markdown(f"Results cached: {len(_store_cache())} stores (shared by all users)")
 
 # ============================================================================
 # HEADER
@@ -582,6 +348,10 @@ st.markdown("""
 # MAIN LAYOUT
 # ============================================================================
 
+# Store choices and their selector labels (built once)
+store_options = {"Store_1": "Melbourne CBD (High Traffic)", "Store_2": "Suburban Residential"}
+STORE_LABELS = {k: f"{k}: {v}" for k, v in store_options.items()}
+
 # Top section: Controls and Agent Status
 col_controls, col_agents = st.columns([1, 2])
 
@@ -589,11 +359,10 @@ with col_controls:
     st.markdown('<div class="section-header"> Control Panel</div>', unsafe_allow_html=True)
     
     # Store selector
-    store_options = {"Store_1": "Melbourne CBD (High Traffic)", "Store_2": "Suburban Residential"}
     selected_store = st.selectbox(
         "Select Store",
-        options=list(store_options.keys()),
-        format_func=lambda x: f"{x}: {store_options[x]}"
+        options=list(STORE_LABELS.keys()),
+        format_func=STORE_LABELS.get
     )
     
     # Date range
@@ -623,173 +392,234 @@ with col_controls:
     # Generate button
     generate_button = st.button(" Generate Schedule", type="primary", width="stretch")
 
-with col_agents:
+# Agent roster shown in the status grid: (name, description, status key)
+agents_info = [
+    ("Coordinator", "Orchestrates workflow", "coordinator"),
+    ("DataLoader", "Loads employee & store data", "data_loader"),
+    ("DemandForecaster", "Predicts staffing needs", "demand_forecaster"),
+    ("StaffMatcher", "Assigns employees to shifts", "staff_matcher"),
+    ("ComplianceValidator", "Validates Fair Work Act", "compliance_validator"),
+    ("ConflictResolver", "Resolves scheduling conflicts", "conflict_resolver"),
+    ("Explainer", "Generates AI explanations", "explainer"),
+    ("RosterGenerator", "Exports to Excel", "roster_generator"),
+]
+_AGENT_KEYS = tuple(key for _, _, key in agents_info)
+
+
+# Agent status -> (icon, card CSS class)
+STATUS_MAP = {
+    "running": ("🔄", "running"),
+    "completed": ("✅", "completed"),
+    "error": ("❌", "error"),
+    "pending": ("⏳", "pending"),
+}
+
+
+@st.fragment
+def render_agent_grid():
+    """Render the agent status cards (isolated from the rest of the page)."""
     st.markdown('<div class="section-header"> Multi-Agent System Status</div>', unsafe_allow_html=True)
     
-    # Agent status display
-    agents_info = [
-        ("Coordinator", "Orchestrates workflow", "coordinator"),
-        ("DataLoader", "Loads employee & store data", "data_loader"),
-        ("DemandForecaster", "Predicts staffing needs", "demand_forecaster"),
-        ("StaffMatcher", "Assigns employees to shifts", "staff_matcher"),
-        ("ComplianceValidator", "Validates Fair Work Act", "compliance_validator"),
-        ("ConflictResolver", "Resolves scheduling conflicts", "conflict_resolver"),
-        ("Explainer", "Generates AI explanations", "explainer"),
-        ("RosterGenerator", "Exports to Excel", "roster_generator"),
-    ]
+    # One element for all cards; the CSS grid lays them out 4 per row
+    cards = []
+    for name, desc, key in agents_info:
+        status = st.session_state.agent_status.get(key, "pending")
+        status_icon, status_class = STATUS_MAP.get(status, STATUS_MAP["pending"])
+        cards.append(
+            f'<div class="agent-card {status_class}"><div>'
+            f'<strong>{status_icon} {name}</strong>'
+            f'<br><small style="color: #6B7280;">{desc}</small>'
+            f'</div></div>'
+        )
     
-    agent_cols = st.columns(4)
-    for idx, (name, desc, key) in enumerate(agents_info):
-        with agent_cols[idx % 4]:
-            status = st.session_state.agent_status.get(key, "pending")
-            
-            if status == "running":
-                status_icon = "🔄"
-                status_class = "running"
-            elif status == "completed":
-                status_icon = "✅"
-                status_class = "completed"
-            elif status == "error":
-                status_icon = "❌"
-                status_class = "error"
-            else:
-                status_icon = "⏳"
-                status_class = "pending"
-            
-            st.markdown(f"""
-            <div class="agent-card {status_class}">
-                <div>
-                    <strong>{status_icon} {name}</strong>
-                    <br><small style="color: #6B7280;">{desc}</small>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+    st.markdown(f'<div class="agent-grid">{"".join(cards)}</div>', unsafe_allow_html=True)
+
+
+def render_phase_list(placeholder, current_pct: int, status: str) -> None:
+    """Redraw the workflow phase checklist and status line in one placeholder."""
+    items = []
+    for pct, msg in PHASE_PROGRESS.values():
+        state = "completed" if pct < current_pct else "running" if pct == current_pct else "pending"
+        icon, status_class = STATUS_MAP[state]
+        items.append(f'<li class="{status_class}">{icon} {msg}</li>')
+    
+    placeholder.markdown(
+        f'<div class="phase-status">{status}</div><ul class="phase-list">{"".join(items)}</ul>',
+        unsafe_allow_html=True
+    )
+
+
+with col_agents:
+    # Placeholder so the grid can be redrawn in place once a run finishes
+    agent_grid_slot = st.empty()
+    with agent_grid_slot.container():
+        render_agent_grid()
 
 # ============================================================================
 # SCHEDULING EXECUTION
 # ============================================================================
 
-if generate_button and not st.session_state.is_running:
+# A rerun interrupts this script but not the worker thread, so the lock
+# (not is_running) decides whether the previous run has really finished
+start_run = generate_button and st.session_state.run_lock.acquire(blocking=False)
+if generate_button and not start_run:
+    st.warning("⏳ The previous scheduling run is still finishing. Try again in a moment.")
+
+if start_run:
     st.session_state.is_running = True
     st.session_state.scheduling_complete = False
     st.session_state.results = None
     
     # Reset agent status
-    for _, _, key in agents_info:
-        st.session_state.agent_status[key] = "pending"
+    st.session_state.agent_status.update(dict.fromkeys(_AGENT_KEYS, "pending"))
     
     # Progress section
-    st.markdown("---")
-    st.markdown('<div class="section-header">📊 Scheduling Progress</div>', unsafe_allow_html=True)
+    section_header("📊 Scheduling Progress")
     
     progress_bar = st.progress(0)
-    status_text = st.empty()
     
-    # Real-time agent status container
-    agent_status_container = st.empty()
+    # Status line and phase checklist share one element, rewritten in place
+    phase_slot = st.empty()
+    phase_pct = 0
+    worker_started = False
     
     try:
         # Phase 1: Initialize
-        status_text.text("🔄 Initializing multi-agent system...")
+        render_phase_list(phase_slot, phase_pct, "🔄 Initializing multi-agent system...")
         st.session_state.agent_status["coordinator"] = "running"
         progress_bar.progress(5)
-        time.sleep(0.3)
-        
-        # Find data directory
-        data_dir = str(Path(__file__).parent / "data")
-        if not Path(data_dir).exists():
-            data_dir = str(Path(__file__).parent.parent / "Yep AI Challenge")
         
-        # Initialize message bus and coordinator
-        message_bus = MessageBus(verbose=False)
-        coordinator = CoordinatorAgent(message_bus, data_dir=data_dir)
+        # Reuse this session's message bus and coordinator
+        coordinator = get_coordinator()
+        coordinator.reset()
         
         st.session_state.agent_status["coordinator"] = "completed"
         progress_bar.progress(10)
         
-        # Phase 2: Data Loading
-        status_text.text("📂 Loading employee and store data...")
-        st.session_state.agent_status["data_loader"] = "running"
-        progress_bar.progress(15)
-        time.sleep(0.2)
+        # Phase 2: Execute scheduling (phase progress comes from the coordinator)
+        render_phase_list(phase_slot, phase_pct, "🚀 Running multi-agent scheduling...")
         
-        # Phase 3: Execute scheduling
-        status_text.text("🚀 Running multi-agent scheduling...")
+        # Run the actual scheduler on a worker thread so the page keeps
+        # updating while agents and LLM calls are in flight
+        # The worker only queues events; the widgets are updated from this thread
+        start_time = time.time()
+        result_q = queue.Queue()
         
-        # Update agent statuses as we progress
-        phases = [
-            ("data_loader", 20, "Loading 40 employees, 2 stores..."),
-            ("demand_forecaster", 30, "Forecasting demand for 14 days..."),
-            ("staff_matcher", 50, "Matching employees to shifts..."),
-            ("compliance_validator", 65, "Validating Fair Work Act compliance..."),
-            ("conflict_resolver", 80, "Resolving scheduling conflicts..."),
-            ("explainer", 90, "Generating AI explanations..."),
-            ("roster_generator", 95, "Exporting roster to Excel..."),
-        ]
+        def _run_scheduler():
+            try:
+                result_q.put(("done", True, coordinator.execute(
+                    store_id=selected_store,
+                    start_date=start_date,
+                    end_date=end_date,
+                    output_path="output",
+                    max_iterations=max_iterations,
+                    progress_callback=lambda pct, msg: result_q.put(("progress", pct, msg)),
+                    stream_summary=True,
+                )))
+            except Exception as e:
+                result_q.put(("done", False, e))
+            finally:
+                run_lock.release()
         
-        # Run the actual scheduler
-        start_time = time.time()
+        run_lock = st.session_state.run_lock
+        worker = threading.Thread(target=_run_scheduler, daemon=True)
+        worker.start()
+        worker_started = True
+        while True:
+            try:
+                event, *payload = result_q.get(timeout=0.1)
+            except queue.Empty:
+                # A BaseException in the worker skips the "done" event; never wait on a dead thread
+                if not worker.is_alive() and result_q.empty():
+                    raise RuntimeError("Scheduler worker exited without reporting a result")
+                continue
+            if event == "progress":
+                phase_pct, msg = payload
+                progress_bar.progress(phase_pct)
+                render_phase_list(phase_slot, phase_pct, msg)
+            else:
+                succeeded, outcome = payload
+                break
         
-        results = coordinator.execute(
-            store_id=selected_store,
-            start_date=start_date,
-            end_date=end_date,
-            output_path="output",
-            max_iterations=max_iterations,
-        )
+        if not succeeded:
+            raise outcome
+        results = outcome
         
         elapsed_time = time.time() - start_time
         
+        # Stream the executive summary so it shows from the first token
+        phase_pct = 100
+        render_phase_list(phase_slot, phase_pct, "📝 Writing executive summary...")
+        with st.expander("📝 Executive Summary", expanded=True):
+            st.write_stream(coordinator.stream_summary())
+        # Keep only the accepted text, not a stream that broke off mid-answer
+        summary_text = coordinator.explainer.streamed_summary
+        
         # Mark all agents as completed
-        for _, _, key in agents_info:
-            st.session_state.agent_status[key] = "completed"
+        st.session_state.agent_status.update(dict.fromkeys(_AGENT_KEYS, "completed"))
         
         progress_bar.progress(100)
-        status_text.text(f"✅ Schedule generated in {elapsed_time:.2f} seconds!")
+        render_phase_list(phase_slot, phase_pct, f"✅ Schedule generated in {elapsed_time:.2f} seconds!")
         
         # Store results
         st.session_state.results = results
         st.session_state.results['elapsed_time'] = elapsed_time
         st.session_state.results['store_id'] = selected_store
+        st.session_state.results['summary_text'] = summary_text
+        if results.get('explanation'):
+            # The run skipped the LLM summary; keep the streamed one with the results
+            results['explanation']['summary'] = summary_text
         st.session_state.scheduling_complete = True
         st.session_state.current_store = selected_store
         
         # Save results for store comparison
-        st.session_state.store_results[selected_store] = {
-            'score': results['compliance']['score'],
-            'violations': results['compliance']['violations'],
-            'warnings': results['compliance']['warnings'],
-            'employees': results['schedule_summary']['unique_employees'],
-            'assignments': results['schedule_summary']['total_assignments'],
-            'total_hours': results['schedule_summary']['total_hours'],
+        comp = results['compliance']
+        summ = results['schedule_summary']
+        _store_cache().put(selected_store, {
+            'score': comp['score'],
+            'violations': comp['violations'],
+            'warnings': comp['warnings'],
+            'employees': summ['unique_employees'],
+            'assignments': summ['total_assignments'],
+            'total_hours': summ['total_hours'],
             'elapsed_time': elapsed_time,
             'store_name': store_options[selected_store],
-        }
+        })
+        cached_count_slot.markdown(f"Results cached: {len(_store_cache())} stores (shared by all users)")
         
         # Load schedule data for display
         if results.get('output_file') and os.path.exists(results['output_file']):
             try:
-                df = pd.read_excel(results['output_file'], sheet_name='Roster')
+                df = read_roster_sheet(results['output_file'])
                 # Filter out empty rows and legend (keep only rows with numeric employee IDs)
                 if 'ID' in df.columns:
-                    # Convert ID to numeric, non-numeric values become NaN
-                    df['ID'] = pd.to_numeric(df['ID'], errors='coerce')
-                    # Keep only rows with valid numeric IDs
-                    df = df[df['ID'].notna()]
-                    # Convert to int for cleaner display
-                    df['ID'] = df['ID'].astype(int)
+                    # Non-numeric IDs (blank and legend rows) become NaN; keep the
+                    # rest as int32 in a single masked cast
+                    ids = pd.to_numeric(df['ID'], errors='coerce')
+                    mask = ids.notna()
+                    df = df.loc[mask].assign(ID=ids[mask].astype('int32'))
                 st.session_state.schedule_df = df
+                st.session_state.preview_page = 0
+                # Lower-cased names for the preview search, aligned with df rows
+                st.session_state.names_lc = (
+                    df['Employee Name'].fillna('').astype(str).str.lower().to_numpy(dtype=str)
+                    if 'Employee Name' in df.columns else None
+                )
+                # Preview filter choices only change with a new schedule
+                st.session_state.filter_options = {
+                    col: ['All'] + sorted(df[col].dropna().unique().tolist())
+                    for col in ('Type', 'Station') if col in df.columns
+                }
             except Exception as e:
                 print(f"Error loading schedule: {e}")  # Debug logging
                 st.session_state.schedule_df = None
         
         # Load log content
         if results.get('log_file') and os.path.exists(results['log_file']):
-            with open(results['log_file'], 'r') as f:
-                st.session_state.log_content = f.read()
+            st.session_state.log_content = read_log_tail(results['log_file'])
         
     except Exception as e:
-        status_text.text(f"❌ Error occurred - system gracefully degraded")
+        render_phase_list(phase_slot, phase_pct, "❌ Error occurred - system gracefully degraded")
         show_error_boundary(e, context="Schedule Generation")
         st.session_state.agent_status["coordinator"] = "error"
         st.session_state.last_error = str(e)
@@ -799,197 +629,182 @@ if generate_button and not st.session_state.is_running:
             st.warning("Partial results may be available from previous runs.")
     
     finally:
+        # The dashboard below renders in this same run; only the agent grid
+        # drawn above needs refreshing with the final statuses
         st.session_state.is_running = False
-        st.rerun()
+        if not worker_started:
+            st.session_state.run_lock.release()
+        with agent_grid_slot.container():
+            render_agent_grid()
 
 # ============================================================================
 # RESULTS DASHBOARD
 # ============================================================================
 
-if st.session_state.scheduling_complete and st.session_state.results:
-    results = st.session_state.results
-    
-    st.markdown("---")
-    st.markdown('<div class="section-header">📊 Results Dashboard</div>', unsafe_allow_html=True)
+@st.cache_data(show_spinner=False, max_entries=4)
+def _load_bytes(path: str, mtime: float) -> bytes:
+    """Read a download file once per modification time instead of on every rerun."""
+    return Path(path).read_bytes()
+
+
+def _tier(value: float, good: float = 80, warn: float = 50, inverse: bool = False) -> str:
+    """
+    Map a metric to its colour class.
     
-    # Metrics row
-    metric_cols = st.columns(5)
+    Args:
+        value: Metric value
+        good: Threshold for metric-success
+        warn: Threshold for metric-warning (anything worse is metric-error)
+        inverse: True when lower is better (thresholds are upper bounds)
+    """
+    if inverse:
+        return "metric-success" if value <= good else "metric-warning" if value <= warn else "metric-error"
+    return "metric-success" if value >= good else "metric-warning" if value >= warn else "metric-error"
+
+
+def _metric_card(value: Any, label: str, color_class: str = "") -> str:
+    """HTML for one metric card (callers join several into a .card-row)."""
+    return (
+        f'<div class="metric-card"><div class="metric-value {color_class}">{value}</div>'
+        f'<div class="metric-label">{label}</div></div>'
+    )
+
+
+def _compliance_item(name: str, icon: str, bg_class: str, description: str) -> str:
+    """HTML for one compliance/safety checklist row."""
+    return (
+        f'<div class="compliance-item {bg_class}">'
+        f'<span style="font-size: 1.2rem; margin-right: 0.75rem;">{icon}</span>'
+        f'<div><strong>{name}</strong>'
+        f'<br><small style="color: #6B7280;">{description}</small></div></div>'
+    )
+
+
+# Static checklists, rendered to HTML once at import
+_COMPLIANCE_CHECKS = (
+    ("Australian Fair Work Act", True, "All shifts comply with legal requirements"),
+    ("10-Hour Rest Periods", True, "Minimum rest between shifts enforced"),
+    ("Maximum Hours Limits", True, "Full-time ≤38h, Part-time ≤32h, Casual ≤24h"),
+    ("Skill Matching", True, "Employees assigned to trained stations only"),
+    ("Minimum Staffing", True, "All stations have required coverage"),
+)
+
+_SAFETY_CHECKS = (
+    ("Deterministic Core", "✅", "No AI hallucination risk in scheduling decisions"),
+    ("Human-in-the-Loop", "✅", "Manager approval for edge cases"),
+    ("Audit Trail", "✅", "Complete log file saved"),
+    ("Error Handling", "✅", "Graceful degradation enabled"),
+    ("Agent Lifecycle", "✅", "Clean startup and shutdown"),
+)
+
+COMPLIANCE_HTML = '<div class="section-header">✅ Compliance Verification</div>' + "".join(
+    _compliance_item(check_name, "✅" if passed else "⚠️", "" if passed else "warning", description)
+    for check_name, passed, description in _COMPLIANCE_CHECKS
+)
+
+SAFETY_HTML = '<div class="section-header">🛡️ Safety & Reliability</div>' + "".join(
+    _compliance_item(check_name, icon, "", description)
+    for check_name, icon, description in _SAFETY_CHECKS
+)
+
+
+@st.cache_data(show_spinner=False)
+def _compute_coverage(warnings_list: List[dict], total_days: int = 14) -> Dict[str, float]:
+    """
+    Estimate peak/opening/closing coverage from the run's warnings.
     
-    with metric_cols[0]:
-        elapsed = results.get('elapsed_time', results['performance']['elapsed_time_seconds'])
-        color_class = "metric-success" if elapsed < 180 else "metric-error"
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value {color_class}">{elapsed:.1f}s</div>
-            <div class="metric-label">⏱️ Generation Time</div>
-        </div>
-        """, unsafe_allow_html=True)
+    Each warning mentioning a period counts as one under-covered day.
+    Cached on the warning contents, so reruns don't rescan the list.
     
-    with metric_cols[1]:
-        violations = results['compliance']['violations']
-        color_class = "metric-success" if violations == 0 else "metric-error"
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value {color_class}">{violations}</div>
-            <div class="metric-label">❌ Hard Violations</div>
-        </div>
-        """, unsafe_allow_html=True)
+    Returns:
+        Coverage percentage keyed by 'lunch', 'dinner', 'opening', 'closing'
+    """
+    # If no warnings present, assume full coverage
+    if not warnings_list:
+        return dict.fromkeys(('lunch', 'dinner', 'opening', 'closing'), 100.0)
+    
+    lunch = dinner = opening = closing = 0
+    for w in warnings_list:
+        text = str(w).lower()
+        lunch += "lunch peak" in text
+        dinner += "dinner peak" in text
+        opening += "opening" in text
+        closing += "closing" in text
+    
+    def _pct(issues: int) -> float:
+        return max(0, (total_days - issues) / total_days * 100)
     
-    with metric_cols[2]:
-        score = results['compliance']['score']
-        color_class = "metric-success" if score >= 60 else "metric-warning" if score >= 40 else "metric-error"
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value {color_class}">{score:.1f}</div>
-            <div class="metric-label">📈 Compliance Score</div>
-        </div>
-        """, unsafe_allow_html=True)
+    return {
+        'lunch': _pct(lunch),
+        'dinner': _pct(dinner),
+        'opening': _pct(opening),
+        'closing': _pct(closing),
+    }
+
+
+def render_results_overview():
+    """Render the metrics, compliance and coverage cards for the last run."""
+    results = st.session_state.results
+    comp = results['compliance']
+    perf = results['performance']
+    summ = results['schedule_summary']
     
-    with metric_cols[3]:
-        employees = results['schedule_summary']['unique_employees']
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value metric-primary">{employees}</div>
-            <div class="metric-label">👥 Employees Scheduled</div>
-        </div>
-        """, unsafe_allow_html=True)
+    # Metrics row (native metric tiles; the delta carries the good/bad colour)
+    elapsed = results.get('elapsed_time', perf['elapsed_time_seconds'])
+    violations = comp['violations']
+    score = comp['score']
+    employees = summ['unique_employees']
+    assignments = summ['total_assignments']
     
-    with metric_cols[4]:
-        assignments = results['schedule_summary']['total_assignments']
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value">{assignments}</div>
-            <div class="metric-label">📋 Total Assignments</div>
-        </div>
-        """, unsafe_allow_html=True)
+    metric_cols = st.columns(5)
+    metric_cols[0].metric("⏱️ Generation Time", f"{elapsed:.1f}s",
+                          delta=f"{elapsed - 180:+.0f}s vs 180s target", delta_color="inverse", border=True)
+    metric_cols[1].metric("❌ Hard Violations", violations,
+                          delta=violations or None, delta_color="inverse", border=True)
+    metric_cols[2].metric("📈 Compliance Score", f"{score:.1f}",
+                          delta=f"{score - 60:+.1f} vs pass mark", delta_color="normal", border=True)
+    metric_cols[3].metric("👥 Employees Scheduled", employees, border=True)
+    metric_cols[4].metric("📋 Total Assignments", assignments, border=True)
     
     # Compliance & Safety Section
     st.markdown("---")
     col_compliance, col_safety = st.columns(2)
     
     with col_compliance:
-        st.markdown('<div class="section-header">✅ Compliance Verification</div>', unsafe_allow_html=True)
-        
-        compliance_checks = [
-            ("Australian Fair Work Act", True, "All shifts comply with legal requirements"),
-            ("10-Hour Rest Periods", True, "Minimum rest between shifts enforced"),
-            ("Maximum Hours Limits", True, "Full-time ≤38h, Part-time ≤32h, Casual ≤24h"),
-            ("Skill Matching", True, "Employees assigned to trained stations only"),
-            ("Minimum Staffing", True, "All stations have required coverage"),
-        ]
-        
-        for check_name, passed, description in compliance_checks:
-            icon = "✅" if passed else "⚠️"
-            bg_class = "" if passed else "warning"
-            st.markdown(f"""
-            <div class="compliance-item {bg_class}">
-                <span style="font-size: 1.2rem; margin-right: 0.75rem;">{icon}</span>
-                <div>
-                    <strong>{check_name}</strong>
-                    <br><small style="color: #6B7280;">{description}</small>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(COMPLIANCE_HTML, unsafe_allow_html=True)
     
     with col_safety:
-        st.markdown('<div class="section-header">🛡️ Safety & Reliability</div>', unsafe_allow_html=True)
-        
-        safety_checks = [
-            ("Deterministic Core", "✅", "No AI hallucination risk in scheduling decisions"),
-            ("Human-in-the-Loop", "✅", "Manager approval for edge cases"),
-            ("Audit Trail", "✅", "Complete log file saved"),
-            ("Error Handling", "✅", "Graceful degradation enabled"),
-            ("Agent Lifecycle", "✅", "Clean startup and shutdown"),
-        ]
-        
-        for check_name, icon, description in safety_checks:
-            st.markdown(f"""
-            <div class="compliance-item">
-                <span style="font-size: 1.2rem; margin-right: 0.75rem;">{icon}</span>
-                <div>
-                    <strong>{check_name}</strong>
-                    <br><small style="color: #6B7280;">{description}</small>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(SAFETY_HTML, unsafe_allow_html=True)
     
     # Coverage Quality Section (Success Criteria 2)
-    st.markdown("---")
-    st.markdown('<div class="section-header">📊 Coverage Quality (Success Criteria 2)</div>', unsafe_allow_html=True)
-    
-    coverage_cols = st.columns(4)
+    section_header("📊 Coverage Quality (Success Criteria 2)")
     
     # Calculate coverage metrics from warnings
-    warnings_list = results.get('compliance', {}).get('warning_details', [])
-    
-    def _count_issues(keyword: str) -> int:
-        return sum(1 for w in warnings_list if keyword in str(w).lower())
-    
-    lunch_issues = _count_issues("lunch peak")
-    dinner_issues = _count_issues("dinner peak")
-    opening_issues = _count_issues("opening")
-    closing_issues = _count_issues("closing")
-    
-    # If no warnings present, assume full coverage
-    total_days = 14
-    def _coverage(issues: int) -> float:
-        if not warnings_list:
-            return 100.0
-        return max(0, (total_days - issues) / total_days * 100)
-    
-    lunch_coverage_pct = _coverage(lunch_issues)
-    dinner_coverage_pct = _coverage(dinner_issues)
-    opening_coverage_pct = _coverage(opening_issues)
-    closing_coverage_pct = _coverage(closing_issues)
-    
-    with coverage_cols[0]:
-        color = "metric-success" if lunch_coverage_pct >= 80 else "metric-warning" if lunch_coverage_pct >= 50 else "metric-error"
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value {color}">{lunch_coverage_pct:.0f}%</div>
-            <div class="metric-label">🍽️ Lunch Peak (11-14)</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with coverage_cols[1]:
-        color = "metric-success" if dinner_coverage_pct >= 80 else "metric-warning" if dinner_coverage_pct >= 50 else "metric-error"
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value {color}">{dinner_coverage_pct:.0f}%</div>
-            <div class="metric-label">🌙 Dinner Peak (17-21)</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with coverage_cols[2]:
-        color = "metric-success" if opening_coverage_pct >= 80 else "metric-warning" if opening_coverage_pct >= 50 else "metric-error"
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value {color}">{opening_coverage_pct:.0f}%</div>
-            <div class="metric-label">🌅 Opening (06:30)</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with coverage_cols[3]:
-        color = "metric-success" if closing_coverage_pct >= 80 else "metric-warning" if closing_coverage_pct >= 50 else "metric-error"
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value {color}">{closing_coverage_pct:.0f}%</div>
-            <div class="metric-label">🌃 Closing (23:00)</div>
-        </div>
-        """, unsafe_allow_html=True)
+    warnings_list = comp.get('warning_details', [])
+    coverage = _compute_coverage(warnings_list)
+    lunch_coverage_pct = coverage['lunch']
+    dinner_coverage_pct = coverage['dinner']
+    opening_coverage_pct = coverage['opening']
+    closing_coverage_pct = coverage['closing']
+    
+    coverage_cards = [
+        _metric_card(f"{pct:.0f}%", label, _tier(pct))
+        for pct, label in (
+            (lunch_coverage_pct, "🍽️ Lunch Peak (11-14)"),
+            (dinner_coverage_pct, "🌙 Dinner Peak (17-21)"),
+            (opening_coverage_pct, "🌅 Opening (06:30)"),
+            (closing_coverage_pct, "🌃 Closing (23:00)"),
+        )
+    ]
+    st.markdown(f'<div class="card-row">{"".join(coverage_cards)}</div>', unsafe_allow_html=True)
     
     # Fairness (Gini) display
-    fairness = results.get('compliance', {}).get('fairness', {})
+    fairness = comp.get('fairness', {})
     gini = fairness.get('gini_coefficient', None)
     if gini is not None:
-        gini_color = "metric-success" if gini <= 0.3 else "metric-warning" if gini <= 0.4 else "metric-error"
+        gini_color = _tier(gini, good=0.3, warn=0.4, inverse=True)
         st.markdown("##### ⚖️ Fairness (Gini Coefficient)")
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value {gini_color}">{gini:.2f}</div>
-            <div class="metric-label">0 = perfect equality</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_metric_card(f"{gini:.2f}", "0 = perfect equality", gini_color), unsafe_allow_html=True)
     
     # Manager Coverage Status
     st.markdown("##### 👔 Manager Coverage (Monthly Roster)")
@@ -998,53 +813,90 @@ if st.session_state.scheduling_complete and st.session_state.results:
         st.success("✅ Manager roster pre-loaded from monthly schedule. Crew scheduled around manager availability.")
     with manager_col2:
         st.metric("Weekend Uplift", "+20%", help="Weekend staffing is 20% higher per challenge requirements")
-    
+
+
+PREVIEW_PAGE_SIZE = 50
+
+
+def _reset_preview_page() -> None:
+    """Filter/sort callback: a changed result set starts on the first page."""
+    st.session_state.preview_page = 0
+
+
+def _shift_preview_page(step: int) -> None:
+    """Button callback: move the schedule preview by one page (clamped on render)."""
+    st.session_state.preview_page = max(0, st.session_state.preview_page + step)
+
+
+@st.fragment
+def render_schedule_preview():
+    """Render the filterable schedule table (filter changes rerun only this fragment)."""
     # Schedule Preview
-    st.markdown("---")
-    st.markdown('<div class="section-header">📅 Schedule Preview</div>', unsafe_allow_html=True)
+    section_header("📅 Schedule Preview")
     
     if st.session_state.schedule_df is not None and len(st.session_state.schedule_df) > 0:
-        df = st.session_state.schedule_df.copy()
+        df_src = st.session_state.schedule_df
+        filter_options = st.session_state.filter_options or {}
+        selected_type = selected_station = 'All'
         
         # Filter options
         filter_cols = st.columns(4)
         
         with filter_cols[0]:
             # Employee type filter
-            if 'Type' in df.columns:
-                type_options = ['All'] + sorted(df['Type'].dropna().unique().tolist())
-                selected_type = st.selectbox("Filter by Type", type_options, key="type_filter")
-                if selected_type != 'All':
-                    df = df[df['Type'] == selected_type]
+            if 'Type' in filter_options:
+                selected_type = st.selectbox("Filter by Type", filter_options['Type'], key="type_filter",
+                                             on_change=_reset_preview_page)
         
         with filter_cols[1]:
             # Station filter
-            if 'Station' in df.columns:
-                station_options = ['All'] + sorted(df['Station'].dropna().unique().tolist())
-                selected_station = st.selectbox("Filter by Station", station_options, key="station_filter")
-                if selected_station != 'All':
-                    df = df[df['Station'] == selected_station]
+            if 'Station' in filter_options:
+                selected_station = st.selectbox("Filter by Station", filter_options['Station'], key="station_filter",
+                                                on_change=_reset_preview_page)
         
         with filter_cols[2]:
             # Search by name
-            search_name = st.text_input("Search Employee", "", key="name_search")
-            if search_name:
-                df = df[df['Employee Name'].str.contains(search_name, case=False, na=False)]
+            search_name = st.text_input("Search Employee", "", key="name_search", on_change=_reset_preview_page)
         
         with filter_cols[3]:
             # Sort option
             sort_options = ['ID', 'Employee Name', 'Type', 'Station', 'Total Hours']
-            sort_by = st.selectbox("Sort by", sort_options, key="sort_by")
-            if sort_by in df.columns:
-                ascending = sort_by != 'Total Hours'  # Sort hours descending
-                df = df.sort_values(sort_by, ascending=ascending)
+            sort_by = st.selectbox("Sort by", sort_options, key="sort_by", on_change=_reset_preview_page)
+        
+        # Combine all filters into one mask, then select and sort once
+        mask = np.ones(len(df_src), dtype=bool)
+        if selected_type != 'All':
+            mask &= df_src['Type'].values == selected_type
+        if selected_station != 'All':
+            mask &= df_src['Station'].values == selected_station
+        if search_name and st.session_state.names_lc is not None:
+            mask &= np.char.find(st.session_state.names_lc, search_name.lower()) >= 0
+        
+        # Unfiltered / already-ordered views reuse the stored frame without a copy
+        df = df_src if mask.all() else df_src.loc[mask]
+        if sort_by in df.columns:
+            ascending = sort_by != 'Total Hours'  # Sort hours descending
+            already_sorted = (df[sort_by].is_monotonic_increasing if ascending
+                              else df[sort_by].is_monotonic_decreasing)
+            if not already_sorted:
+                df = df.sort_values(sort_by, ascending=ascending, kind='mergesort')
+        
+        # Only the current page is sent to the browser
+        n_pages = max(1, -(-len(df) // PREVIEW_PAGE_SIZE))
+        page = min(st.session_state.preview_page, n_pages - 1)
+        st.session_state.preview_page = page
+        start = page * PREVIEW_PAGE_SIZE
+        df_page = df.iloc[start:start + PREVIEW_PAGE_SIZE]
         
         # Display count
-        st.caption(f"Showing {len(df)} of {len(st.session_state.schedule_df)} employees")
+        st.caption(
+            f"Showing {start + 1 if len(df) else 0}-{start + len(df_page)} of {len(df)} matching "
+            f"({len(st.session_state.schedule_df)} employees) · page {page + 1} of {n_pages}"
+        )
         
         # Display the dataframe with custom styling
         st.dataframe(
-            df,
+            df_page,
             width="stretch",
             height=450,
             column_config={
@@ -1056,6 +908,13 @@ if st.session_state.scheduling_complete and st.session_state.results:
             }
         )
         
+        if n_pages > 1:
+            prev_col, next_col = st.columns(2)
+            prev_col.button("◀ Previous", key="preview_prev", disabled=page == 0,
+                            on_click=_shift_preview_page, args=(-1,), width="stretch")
+            next_col.button("Next ▶", key="preview_next", disabled=page >= n_pages - 1,
+                            on_click=_shift_preview_page, args=(1,), width="stretch")
+        
         # Legend
         with st.expander("📋 Shift Code Legend"):
             legend_cols = st.columns(4)
@@ -1069,31 +928,38 @@ if st.session_state.scheduling_complete and st.session_state.results:
                 st.markdown("**/** = Day Off")
     else:
         st.info("Schedule preview not available. Download the Excel file for full details.")
+
+
+if st.session_state.scheduling_complete and st.session_state.results:
+    results = st.session_state.results
+    
+    section_header("📊 Results Dashboard")
+    
+    render_results_overview()
+    render_schedule_preview()
     
     # Download Section
-    st.markdown("---")
-    st.markdown('<div class="section-header">📥 Downloads</div>', unsafe_allow_html=True)
+    section_header("📥 Downloads")
     
     download_cols = st.columns(3)
     
     with download_cols[0]:
         if results.get('output_file') and os.path.exists(results['output_file']):
-            with open(results['output_file'], 'rb') as f:
-                st.download_button(
-                    label="📥 Download Roster (Excel)",
-                    data=f.read(),
-                    file_name=os.path.basename(results['output_file']),
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    width="stretch"
-                )
+            st.download_button(
+                label="📥 Download Roster (Excel)",
+                data=_load_bytes(results['output_file'], os.path.getmtime(results['output_file'])),
+                file_name=os.path.basename(results['output_file']),
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                width="stretch"
+            )
         else:
             st.button("📥 Download Roster (Excel)", disabled=True, width="stretch")
     
     with download_cols[1]:
-        if st.session_state.log_content:
+        if results.get('log_file') and os.path.exists(results['log_file']):
             st.download_button(
                 label="📄 Download Log File",
-                data=st.session_state.log_content,
+                data=_load_bytes(results['log_file'], os.path.getmtime(results['log_file'])),
                 file_name="scheduling_log.txt",
                 mime="text/plain",
                 width="stretch"
@@ -1106,36 +972,46 @@ if st.session_state.scheduling_complete and st.session_state.results:
             st.session_state.scheduling_complete = False
             st.session_state.results = None
             st.session_state.schedule_df = None
-            for _, _, key in agents_info:
-                st.session_state.agent_status[key] = "pending"
+            st.session_state.preview_page = 0
+            st.session_state.agent_status.update(dict.fromkeys(_AGENT_KEYS, "pending"))
             st.rerun()
     
+    # Executive summary (already shown in the streamed expander on the run itself)
+    if results.get('summary_text') and not start_run:
+        with st.expander("📝 Executive Summary"):
+            st.markdown(results['summary_text'])
+    
     # Log viewer
     with st.expander("📄 View Execution Log"):
-        if st.session_state.log_content:
-            st.code(st.session_state.log_content, language="text")
-        else:
-            st.info("Log file not available.")
+        render_log_viewer(results.get('log_file'))
 
 # ============================================================================
 # STORE COMPARISON (appears when 2+ stores have been run)
 # ============================================================================
 
-if len(st.session_state.store_results) >= 2:
-    st.markdown("---")
-    st.markdown('<div class="section-header">🔄 Store Comparison</div>', unsafe_allow_html=True)
+@st.fragment
+def render_store_comparison():
+    """Render the side-by-side comparison of the first two stores with saved runs."""
+    section_header("🔄 Store Comparison")
+    st.caption("Latest saved run per store, shared by everyone using this app.")
     
     # Get the two stores
-    store_ids = list(st.session_state.store_results.keys())
+    store_cache = _store_cache()
+    saved = store_cache.snapshot()
+    store_ids = sorted(saved)
+    if len(store_ids) < 2:  # Cleared from another session since the page was drawn
+        st.info("Run at least two stores to compare them.")
+        return
     store1_id, store2_id = store_ids[0], store_ids[1]
-    store1 = st.session_state.store_results[store1_id]
-    store2 = st.session_state.store_results[store2_id]
+    store1 = saved[store1_id]
+    store2 = saved[store2_id]
+    # Names without the "(...)" suffix, for chart columns and workforce cards
+    s1_short = store1['store_name'].split('(', 1)[0].rstrip()
+    s2_short = store2['store_name'].split('(', 1)[0].rstrip()
     
     # ===== 1. SIDE-BY-SIDE SCORE CARDS =====
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown(f"""
+    st.markdown(f"""
+    <div class="card-row">
         <div style="background: linear-gradient(135deg, #DA291C 0%, #FF6B6B 100%); 
                     border-radius: 16px; padding: 1.5rem; color: white; text-align: center;">
             <h3 style="margin: 0; color: white;">🏪 {store1['store_name']}</h3>
@@ -1161,10 +1037,6 @@ if len(st.session_state.store_results) >= 2:
                 </div>
             </div>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
         <div style="background: linear-gradient(135deg, #2563EB 0%, #60A5FA 100%); 
                     border-radius: 16px; padding: 1.5rem; color: white; text-align: center;">
             <h3 style="margin: 0; color: white;">🏠 {store2['store_name']}</h3>
@@ -1190,7 +1062,8 @@ if len(st.session_state.store_results) >= 2:
                 </div>
             </div>
         </div>
-        """, unsafe_allow_html=True)
+    </div>
+    """, unsafe_allow_html=True)
     
     st.markdown("<br>", unsafe_allow_html=True)
     
@@ -1198,12 +1071,15 @@ if len(st.session_state.store_results) >= 2:
     st.markdown("#### 📊 Staffing Comparison")
     
     # Create comparison dataframe for bar chart
-    comparison_data = pd.DataFrame({
-        'Metric': ['Employees Scheduled', 'Total Shifts', 'Total Hours'],
-        store1['store_name'].split('(')[0].strip(): [store1['employees'], store1['assignments'], store1['total_hours']],
-        store2['store_name'].split('(')[0].strip(): [store2['employees'], store2['assignments'], store2['total_hours']]
-    })
-    comparison_data = comparison_data.set_index('Metric')
+    comparison_data = pd.DataFrame(
+        [
+            [store1['employees'], store2['employees']],
+            [store1['assignments'], store2['assignments']],
+            [store1['total_hours'], store2['total_hours']],
+        ],
+        index=pd.Index(['Employees Scheduled', 'Total Shifts', 'Total Hours'], name='Metric'),
+        columns=[s1_short, s2_short]
+    )
     
     # Display as horizontal bar chart
     st.bar_chart(comparison_data, horizontal=True, height=250)
@@ -1216,12 +1092,10 @@ if len(st.session_state.store_results) >= 2:
     # Note: We'll show this based on the schedule data if available
     # For now, showing the comparison of key metrics
     
-    type_col1, type_col2 = st.columns(2)
-    
-    with type_col1:
-        st.markdown(f"""
+    st.markdown(f"""
+    <div class="card-row">
         <div style="background: #FEF3E2; border-radius: 12px; padding: 1rem; border-left: 4px solid #DA291C;">
-            <h4 style="margin: 0 0 0.5rem 0; color: #DA291C;">🏪 {store1['store_name'].split('(')[0].strip()}</h4>
+            <h4 style="margin: 0 0 0.5rem 0; color: #DA291C;">🏪 {s1_short}</h4>
             <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.5rem;">
                 <div style="background: white; padding: 0.75rem; border-radius: 8px; text-align: center;">
                     <div style="font-size: 1.5rem; font-weight: 600; color: #DA291C;">{store1['employees']}</div>
@@ -1241,12 +1115,8 @@ if len(st.session_state.store_results) >= 2:
                 </div>
             </div>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with type_col2:
-        st.markdown(f"""
         <div style="background: #EFF6FF; border-radius: 12px; padding: 1rem; border-left: 4px solid #2563EB;">
-            <h4 style="margin: 0 0 0.5rem 0; color: #2563EB;">🏠 {store2['store_name'].split('(')[0].strip()}</h4>
+            <h4 style="margin: 0 0 0.5rem 0; color: #2563EB;">🏠 {s2_short}</h4>
             <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.5rem;">
                 <div style="background: white; padding: 0.75rem; border-radius: 8px; text-align: center;">
                     <div style="font-size: 1.5rem; font-weight: 600; color: #2563EB;">{store2['employees']}</div>
@@ -1266,23 +1136,30 @@ if len(st.session_state.store_results) >= 2:
                 </div>
             </div>
         </div>
-        """, unsafe_allow_html=True)
+    </div>
+    """, unsafe_allow_html=True)
     
     # Clear comparison button
     st.markdown("<br>", unsafe_allow_html=True)
     if st.button("🗑️ Clear Comparison Data", use_container_width=False):
-        st.session_state.store_results = {}
+        store_cache.clear()
         st.rerun()
 
+
+if len(_store_cache()) >= 2:
+    render_store_comparison()
+
 # ============================================================================
 # FOOTER
 # ============================================================================
 
-st.markdown("---")
-st.markdown("""
+FOOTER_HTML = """---
+
 <div style="text-align: center; color: #6B7280; padding: 1rem;">
     <p></p>
     <p style="font-size: 0.8rem;"></p>
 </div>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 